@@ -1,7 +1,119 @@
+import asyncio
+import functools
+import itertools
+import logging as stdlogging
+import time
+from typing import Any, AsyncIterator, Iterable, Optional
+
+import aiohttp
+import numpy as np
+from numpy.typing import NDArray
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import Web3Exception
+
+from hetu.chain_data.info_base import InfoBase
+from hetu import settings
 from hetu.metagraph import AsyncMetagraph
+from hetu.settings import DEFAULT_POLL_LATENCY, GAS_ESTIMATE_MARGIN, NETWORKS, NETWORK_MAP
 from hetu.types import HetutensorMixin
+from hetu.utils import abi, multicall as mc
 from hetu.utils.balance import Balance
-from hetu.utils.btlogging import logging
+from hetu.utils.caching import DiskCache, ttl_lru_cache
+from hetu.utils.networking import get_async_http_session
+
+# Errors an RPC can legitimately fail with (node errors, transport, malformed responses). Anything else is a bug
+# in the caller or in this module and is left to propagate.
+_RPC_ERRORS = (Web3Exception, aiohttp.ClientError, OSError, ValueError)
+
+
+def _rpc(action: str, default: Any = None):
+    """
+    Async counterpart of :func:`hetu.hetu._rpc`: logs RPC failures (when ``log_verbose``) and returns ``default``
+    instead of raising. ``default`` may be a callable producing a fresh value.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await fn(self, *args, **kwargs)
+            except _RPC_ERRORS as e:
+                self._log(stdlogging.ERROR, "%s%s failed: %s", action, args, e)
+            return default() if callable(default) else default
+
+        return wrapper
+
+    return decorator
+
+
+class _CallBatcher:
+    """
+    Collects the ``eth_call`` requests issued within a short window and sends each block's batch as one Multicall3
+    ``aggregate3``, resolving every caller's future with its own result.
+
+    Args:
+        client (AsyncHetutensor): Client whose :meth:`~AsyncHetutensor.multicall` and :meth:`~AsyncHetutensor._eth_call`
+            are used.
+        window (float): Seconds to wait for more calls after the first one of a batch.
+        max_batch_size (int): A batch is sent immediately once it holds this many calls.
+    """
+
+    def __init__(self, client: "AsyncHetutensor", window: float, max_batch_size: int = 500):
+        self._client = client
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: dict[Optional[int], list[tuple[str, str, asyncio.Future]]] = {}
+        self._timers: dict[Optional[int], asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    async def submit(self, to: str, data: str, block: Optional[int]) -> Optional[str]:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch = self._pending.setdefault(block, [])
+        batch.append((to, data, future))
+        if len(batch) >= self._max_batch_size:
+            self._flush(block)
+        elif len(batch) == 1:
+            self._timers[block] = loop.call_later(self._window, self._flush, block)
+        return await future
+
+    def _flush(self, block: Optional[int]):
+        timer = self._timers.pop(block, None)
+        if timer is not None:
+            timer.cancel()
+        batch = self._pending.pop(block, None)
+        if batch:
+            task = asyncio.ensure_future(self._send(batch, block))
+            # Keep a reference until done; the event loop only holds weak references to tasks.
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list[tuple[str, str, asyncio.Future]], block: Optional[int]):
+        try:
+            results = None
+            if len(batch) > 1:
+                data = await self._client.multicall([(to, data) for to, data, _ in batch], block)
+                if data is not None:
+                    # Same format as ``_eth_call`` (``HexBytes.hex()``), whether or not a call was batched.
+                    results = [None if d is None else d.hex() for d in data]
+            if results is None:
+                results = await asyncio.gather(
+                    *(self._client._eth_call(to, data, block) for to, data, _ in batch)
+                )
+        except asyncio.CancelledError:
+            for _, _, future in batch:
+                future.cancel()
+            raise
+        except BaseException as e:
+            # The waiting callers re-raise the error; this task itself is never awaited.
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
 
 class AsyncHetutensor(HetutensorMixin):
     """
@@ -16,31 +128,72 @@ class AsyncHetutensor(HetutensorMixin):
         fallback_endpoints=None,
         retry_forever=False,
         _mock=False,
+        call_batch_window: Optional[float] = None,
     ):
+        """
+        Args:
+            call_batch_window (Optional[float]): When set, contract reads issued within this many seconds of each
+                other are sent together as one Multicall3 call (e.g. ``0.005``). Reads then execute with Multicall3 as
+                ``msg.sender``. Disabled by default.
+        """
         self.network = network or "hetu-local"
         self._config = config
         self.log_verbose = log_verbose
-        self.chain_endpoint = "http://localhost:8545"  # Default mock endpoint
-        if self.log_verbose:
-            logging.info(
-                f"Connected to {self.network} network at {self.chain_endpoint} (EVM mock mode, async)."
-            )
+        if network in NETWORKS:
+            self.chain_endpoint = NETWORK_MAP[network]
+        else:
+            self.chain_endpoint = "http://localhost:8545"  # Default mock endpoint
+        # AsyncHTTPProvider keeps one aiohttp session, so concurrent reads share its connection pool. A tuned
+        # session is installed by initialize()/__aenter__, which run inside the event loop.
+        self._session_installed = False
+        self._chain_id: Optional[int] = None
+        self._block_time: Optional[float] = None
+        self._fee_params: Optional[tuple[float, dict]] = None  # (fetched_at, fee fields)
+        self._nonces: dict[str, int] = {}
+        self._nonce_lock = asyncio.Lock()
+        self._contracts: dict[tuple[str, int], tuple[list, Any]] = {}
+        self._call_batcher = (
+            _CallBatcher(self, call_batch_window) if call_batch_window else None
+        )
+        self._disk_cache: Optional[DiskCache] = (
+            DiskCache(settings.CALL_CACHE_PATH) if settings.CALL_CACHE_PATH else None
+        )
+        self.web3 = AsyncWeb3(
+            AsyncHTTPProvider(self.chain_endpoint, request_kwargs={"timeout": 10})
+        )
+        self._log(
+            stdlogging.INFO,
+            "Using %s network at %s (async JSON-RPC).",
+            self.network,
+            self.chain_endpoint,
+        )
 
     async def close(self):
-        pass
+        await self.web3.provider.disconnect()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
+
+    async def _install_session(self):
+        if not self._session_installed:
+            self._session_installed = True
+            await self.web3.provider.cache_async_session(get_async_http_session())
 
     async def initialize(self):
-        if self.log_verbose:
-            logging.info(
-                f"[magenta]Connecting to Hetu EVM:[/magenta] [blue]{self}[/blue][magenta]...[/magenta]"
-            )
+        await self._install_session()
+        self._log(
+            stdlogging.INFO,
+            "[magenta]Connecting to Hetu EVM:[/magenta] [blue]%s[/blue][magenta]...[/magenta]",
+            self,
+        )
         return self
 
     async def __aenter__(self):
-        if self.log_verbose:
-            logging.info(
-                f"[magenta]Connecting to Hetu EVM:[/magenta] [blue]{self}[/blue][magenta]...[/magenta]"
-            )
+        await self._install_session()
+        self._log(
+            stdlogging.INFO,
+            "[magenta]Connecting to Hetu EVM:[/magenta] [blue]%s[/blue][magenta]...[/magenta]",
+            self,
+        )
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -69,11 +222,16 @@ class AsyncHetutensor(HetutensorMixin):
     async def block(self):
         return await self.get_current_block()
 
+    @_rpc("web3.eth.block_number", default=0)
     async def get_current_block(self):
-        return 0
+        """Returns the latest block number using web3."""
+        return await self.web3.eth.block_number
 
+    @_rpc("web3.eth.get_block", default="0x" + "0" * 64)
     async def get_block_hash(self, block=None):
-        return "0x0000000000000000000000000000000000000000000000000000000000000000"
+        """Returns the block hash for a given block number using web3."""
+        block_obj = await self.web3.eth.get_block(self._block_identifier(block))
+        return block_obj.hash.hex()
 
     async def determine_block_hash(self, *args, **kwargs):
         return None
@@ -86,11 +244,37 @@ class AsyncHetutensor(HetutensorMixin):
     async def get_all_subnets_info(self, *args, **kwargs):
         return []
 
-    async def get_balance(self, *args, **kwargs):
-        return Balance(0)
-
-    async def get_balances(self, *addresses, **kwargs):
-        return {address: Balance(0) for address in addresses}
+    @_rpc("web3.eth.get_balance", default=lambda: Balance(0))
+    async def get_balance(self, address: str, block: Optional[int] = None):
+        """Returns the ETH balance for an address using web3."""
+        block_param = self._block_identifier(block)
+        balance_wei = await self.web3.eth.get_balance(
+            abi.checksum_address(address), block_identifier=block_param
+        )
+        return Balance(balance_wei)
+
+    async def get_balances(self, *addresses, block: Optional[int] = None):
+        """Returns the ETH balances of several addresses, queried concurrently."""
+        balances = await asyncio.gather(
+            *(self.get_balance(address, block=block) for address in addresses)
+        )
+        return dict(zip(addresses, balances))
+
+    async def get_token_balances(
+        self, token: str, *owners: str, block: Optional[int] = None
+    ) -> dict[str, Optional[int]]:
+        """Async counterpart of :meth:`hetu.hetu.Hetutensor.get_token_balances`."""
+        results = await self.multiread(
+            [
+                (token, "balanceOf(address)", (abi.checksum_address(owner),), ("uint256",))
+                for owner in owners
+            ],
+            block=block,
+        )
+        return {
+            owner: None if result is None else result[0]
+            for owner, result in zip(owners, results)
+        }
 
     async def get_hyperparameter(self, *args, **kwargs):
         return None
@@ -137,6 +321,536 @@ class AsyncHetutensor(HetutensorMixin):
     async def metagraph(self, *args, **kwargs):
         return AsyncMetagraph()
 
+    # ===================== EVM/ETH Contract Reads =====================
+
+    @ttl_lru_cache(maxsize=4096, ttl=float("inf"), latest_ttl=2.0)
+    async def call(self, to: str, data: str, block: Optional[int] = None) -> Optional[str]:
+        """
+        Executes a read-only ``eth_call``. Results are cached like :meth:`hetu.hetu.Hetutensor.call`, including the
+        persistent cache of block-pinned results. With ``call_batch_window`` set, concurrent calls are coalesced into
+        one Multicall3 request.
+        """
+        disk_key = None
+        if block is not None and self._disk_cache is not None:
+            disk_key = self._disk_call_key(to, data, block)
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                return cached
+        if self._call_batcher is not None and to.lower() != mc.MULTICALL3_ADDRESS.lower():
+            result = await self._call_batcher.submit(to, data, block)
+        else:
+            result = await self._eth_call(to, data, block)
+        if disk_key is not None and result is not None:
+            self._disk_cache.set(disk_key, result)
+        return result
+
+    @_rpc("web3.eth.call", default=None)
+    async def _eth_call(self, to: str, data: str, block: Optional[int] = None) -> Optional[str]:
+        block_param = self._block_identifier(block)
+        result = await self.web3.eth.call(
+            {"to": abi.checksum_address(to), "data": data}, block_identifier=block_param
+        )
+        return result.hex() if isinstance(result, bytes) else result
+
+    async def read_contract(
+        self,
+        address: str,
+        signature: str,
+        args: tuple = (),
+        output_types: tuple[str, ...] = (),
+        block: Optional[int] = None,
+    ) -> Optional[tuple]:
+        """Async counterpart of :meth:`hetu.hetu.Hetutensor.read_contract`."""
+        result = await self.call(address, abi.encode_call(signature, args), block)
+        if result is None:
+            return None
+        try:
+            return abi.decode_result(output_types, mc.to_bytes(result))
+        except Exception as e:
+            self._log(
+                stdlogging.ERROR,
+                "Decoding %s result from %s failed: %s",
+                signature,
+                address,
+                e,
+            )
+            return None
+
+    async def multicall(
+        self,
+        calls: list[tuple[str, str]],
+        block: Optional[int] = None,
+        allow_failure: bool = True,
+    ) -> Optional[list[Optional[bytes]]]:
+        """Async counterpart of :meth:`hetu.hetu.Hetutensor.multicall`: several view calls in one Multicall3 ``eth_call``."""
+        if not calls:
+            return []
+        result = await self.call(
+            mc.MULTICALL3_ADDRESS, mc.encode_aggregate3(calls, allow_failure), block
+        )
+        if result is None:
+            return None
+        try:
+            return [data if ok else None for ok, data in mc.decode_aggregate3(result)]
+        except Exception as e:
+            self._log(stdlogging.ERROR, "Multicall3 result decoding failed: %s", e)
+            return None
+
+    async def batch_request(
+        self, requests: list[tuple[str, list]], batch_size: int = 25
+    ) -> list[dict]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.batch_request`: sends independent JSON-RPC requests as
+        batches of at most ``batch_size`` and returns the raw responses in request order.
+
+        Raises:
+            ValueError: If the node rejects batching altogether.
+        """
+        responses: list[dict] = []
+        for start in range(0, len(requests), batch_size):
+            chunk = await self.web3.provider.make_batch_request(
+                requests[start : start + batch_size]
+            )
+            if not isinstance(chunk, list):
+                raise ValueError(f"JSON-RPC batch rejected: {chunk}")
+            responses.extend(chunk)
+        return responses
+
+    async def batch_call(
+        self, calls: list[tuple[str, str]], block: Optional[int] = None
+    ) -> Optional[list[Optional[bytes]]]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.batch_call`: several ``eth_call`` requests in one JSON-RPC
+        batch, for chains without Multicall3. ``None`` if the batch itself failed.
+        """
+        if not calls:
+            return []
+        block_id = self._rpc_block_identifier(block)
+        try:
+            responses = await self.batch_request(
+                [
+                    ("eth_call", [{"to": to, "data": data}, block_id])
+                    for to, data in calls
+                ]
+            )
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.ERROR, "Batched eth_call failed: %s", e)
+            return None
+        return [
+            mc.to_bytes(response["result"]) if response.get("result") is not None else None
+            for response in responses
+        ]
+
+    async def multiread(
+        self,
+        reads: list[tuple[str, str, tuple, tuple[str, ...]]],
+        block: Optional[int] = None,
+    ) -> list[Optional[tuple]]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.multiread`: decodes several contract view calls executed in a
+        single Multicall3 round-trip. Falls back to a JSON-RPC batch (:meth:`batch_call`) when Multicall3 is not
+        deployed, and to concurrent single reads (:meth:`read_contracts`) when batching is not supported either.
+
+        Args:
+            reads (list[tuple[str, str, tuple, tuple[str, ...]]]): ``(address, signature, args, output_types)`` per read.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            list[Optional[tuple]]: The decoded results in order, ``None`` for reverted reads.
+        """
+        calls = [
+            (address, abi.encode_call(signature, args))
+            for address, signature, args, _ in reads
+        ]
+        results = await self.multicall(calls, block=block)
+        if results is None:
+            results = await self.batch_call(calls, block=block)
+        if results is None:
+            return await self.read_contracts(reads, block=block)
+        decoded: list[Optional[tuple]] = []
+        for (address, signature, _, output_types), data in zip(reads, results):
+            try:
+                decoded.append(
+                    None if data is None else abi.decode_result(output_types, data)
+                )
+            except Exception as e:
+                self._log(
+                    stdlogging.ERROR, "Decoding %s result from %s failed: %s", signature, address, e
+                )
+                decoded.append(None)
+        return decoded
+
+    async def read_contracts(
+        self,
+        reads: list[tuple[str, str, tuple, tuple[str, ...]]],
+        block: Optional[int] = None,
+        max_concurrency: int = 16,
+    ) -> list[Optional[tuple]]:
+        """
+        Runs several :meth:`read_contract` calls concurrently with ``asyncio.gather`` and returns them in order.
+
+        Works on providers that reject JSON-RPC batches. At most ``max_concurrency`` requests are in flight, which
+        keeps large sweeps under typical provider rate limits.
+
+        Args:
+            reads (list[tuple[str, str, tuple, tuple[str, ...]]]): ``(address, signature, args, output_types)`` per read.
+            block (Optional[int]): Block number to execute all reads against. Defaults to ``latest``.
+            max_concurrency (int): Maximum number of concurrent RPCs.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def read(address, signature, args, output_types):
+            async with semaphore:
+                return await self.read_contract(
+                    address, signature, args, output_types, block=block
+                )
+
+        return list(await asyncio.gather(*(read(*r) for r in reads)))
+
+    async def iter_multiread(
+        self,
+        reads: Iterable[tuple[str, str, tuple, tuple[str, ...]]],
+        page_size: int = 500,
+        block: Optional[int] = None,
+    ) -> AsyncIterator[Optional[tuple]]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.iter_multiread`. The next page is requested while the
+        results of the current one are consumed, so at most two pages are held at a time.
+        """
+        task: Optional[asyncio.Future] = None
+        try:
+            for page in itertools.batched(reads, page_size):
+                previous, task = task, asyncio.ensure_future(self.multiread(list(page), block=block))
+                if previous is not None:
+                    for result in await previous:
+                        yield result
+            if task is not None:
+                for result in await task:
+                    yield result
+        finally:
+            if task is not None and not task.done():
+                task.cancel()
+
+    async def multiread_columns(
+        self,
+        address: str,
+        signature: str,
+        args_list: list[tuple],
+        output_types: tuple[str, ...],
+        block: Optional[int] = None,
+    ) -> tuple[NDArray[np.bool_], list[NDArray]]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.multiread_columns`: the results of many reads of one view
+        function as a success mask and one numpy array per output.
+        """
+        results = await self.multiread(
+            [(address, signature, args, output_types) for args in args_list], block=block
+        )
+        return self._results_to_columns(results, output_types)
+
+    async def read_infos(
+        self,
+        address: str,
+        signature: str,
+        args_list: list[tuple],
+        output_types: tuple[str, ...],
+        info_class: type[InfoBase],
+        block: Optional[int] = None,
+    ) -> list[InfoBase]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.multiread_info`: reads a struct-returning view function for
+        many arguments with :meth:`multiread` and drops the reads that reverted (e.g. ids that do not exist).
+        """
+        results = await self.multiread(
+            [(address, signature, args, output_types) for args in args_list], block=block
+        )
+        unwrap = len(output_types) == 1 and output_types[0].startswith("(")
+        infos = [
+            info_class.from_tuple(result[0] if unwrap else result)
+            for result in results
+            if result is not None
+        ]
+        if len(infos) < len(args_list):
+            self._log(
+                stdlogging.INFO,
+                "Skipped %d of %d %s reads that reverted",
+                len(args_list) - len(infos),
+                len(args_list),
+                signature,
+            )
+        return infos
+
+    # ===================== EVM/ETH Transactions =====================
+
+    async def get_chain_id(self) -> int:
+        """Returns the chain id of the endpoint, fetched once (it never changes)."""
+        if self._chain_id is None:
+            self._chain_id = await self.web3.eth.chain_id
+        return self._chain_id
+
+    async def get_fee_params(self, max_age: float = 3.0) -> dict:
+        """
+        Returns EIP-1559 fee fields derived from one ``eth_feeHistory`` call, or a legacy ``gasPrice`` on chains
+        without a base fee. Values fetched less than ``max_age`` seconds ago are reused.
+        """
+        now = time.monotonic()
+        if self._fee_params is not None and now - self._fee_params[0] <= max_age:
+            return self._fee_params[1]
+        params = None
+        try:
+            params = self._fee_params_from_history(
+                await self.web3.eth.fee_history(
+                    self._FEE_HISTORY_BLOCKS, "latest", [self._FEE_HISTORY_PERCENTILE]
+                )
+            )
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.INFO, "eth_feeHistory unavailable, using gasPrice: %s", e)
+        if params is None:
+            params = {"gasPrice": await self.web3.eth.gas_price}
+        self._fee_params = (now, params)
+        return params
+
+    async def reserve_nonces(self, address: str, count: int = 1) -> int:
+        """
+        Reserves ``count`` consecutive nonces for ``address`` and returns the first one.
+
+        The pending nonce is fetched once and then handed out locally, so back-to-back sends need no
+        ``eth_getTransactionCount`` and concurrent callers never get the same nonce. Call :meth:`reset_nonce` when a
+        send fails so that the next reservation re-syncs with the node.
+        """
+        async with self._nonce_lock:
+            nonce = self._nonces.get(address)
+            if nonce is None:
+                nonce = await self.web3.eth.get_transaction_count(address, "pending")
+            self._nonces[address] = nonce + count
+            return nonce
+
+    def reset_nonce(self, address: str):
+        """Forgets the locally tracked nonce of ``address``."""
+        self._nonces.pop(address, None)
+
+    async def _send_signed(self, wallet, tx: dict) -> Optional[str]:
+        try:
+            # Signing (keccak + ECDSA) is CPU bound; run it off the event loop so that concurrent sends overlap
+            # their signing with the submissions already on the wire.
+            signed = await asyncio.to_thread(wallet.sign_transaction, tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(signed.raw_transaction)
+            return self.web3.to_hex(tx_hash)
+        except Exception as e:
+            self._log(stdlogging.ERROR, "web3 send_raw_transaction failed: %s", e)
+            return None
+
+    async def send_transactions(
+        self,
+        wallet,
+        txs: list[dict],
+        wait_for_inclusion: bool = False,
+        tx_timeout: float = 120.0,
+        poll_latency: Optional[float] = None,
+    ) -> list[Optional[str]]:
+        """
+        Signs and submits several transactions from ``wallet`` concurrently.
+
+        Nonces are reserved locally with :meth:`reserve_nonces` (one ``eth_getTransactionCount`` per wallet, not per
+        call), so the sends do not wait on each other and total wall time is roughly one submission round-trip plus
+        one block instead of one block per transaction. If one submission is rejected, the later nonces stay pending
+        until that nonce is used, and the local nonce is re-synced on the next call.
+
+        Args:
+            wallet (LocalAccount): Sending account, e.g. from ``Account.create()`` or ``Account.from_key()``.
+            txs (list[dict]): Transactions with at least ``to`` and ``gas``; ``value``/``data`` are optional.
+            wait_for_inclusion (bool): Wait for all receipts and report reverted transactions as ``None``.
+            tx_timeout (float): Maximum time to wait for each receipt in seconds.
+            poll_latency (Optional[float]): Initial delay between receipt polls in seconds. Defaults to
+                :meth:`default_poll_latency`.
+
+        Returns:
+            list[Optional[str]]: The transaction hash of each submission, ``None`` where it failed.
+        """
+        if not txs:
+            return []
+        try:
+            nonce, fee_params, chain_id = await asyncio.gather(
+                self.reserve_nonces(wallet.address, len(txs)),
+                self.get_fee_params(),
+                self.get_chain_id(),
+            )
+        except Exception as e:
+            self.reset_nonce(wallet.address)
+            self._log(stdlogging.ERROR, "Fetching transaction parameters failed: %s", e)
+            return [None] * len(txs)
+        tx_hashes = await asyncio.gather(
+            *(
+                self._send_signed(
+                    wallet,
+                    {
+                        "value": 0,
+                        **tx,
+                        **fee_params,
+                        "nonce": nonce + i,
+                        "chainId": chain_id,
+                    },
+                )
+                for i, tx in enumerate(txs)
+            )
+        )
+        if None in tx_hashes:
+            self.reset_nonce(wallet.address)
+            self.invalidate_fee_params()
+        if any(tx_hashes):
+            self.invalidate_call_cache()
+        if not wait_for_inclusion:
+            return list(tx_hashes)
+        receipts = await self.wait_for_transaction_receipts(
+            [tx_hash for tx_hash in tx_hashes if tx_hash], tx_timeout, poll_latency
+        )
+        return [
+            tx_hash if tx_hash and (receipts.get(tx_hash) or {}).get("status") == 1 else None
+            for tx_hash in tx_hashes
+        ]
+
+    async def send_contract_transaction(
+        self,
+        wallet,
+        address: str,
+        signature: str,
+        args: tuple = (),
+        value: int = 0,
+        gas: Optional[int] = None,
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        Async counterpart of :meth:`hetu.hetu.Hetutensor.send_contract_transaction`. Independent calls can run
+        concurrently with ``asyncio.gather``: nonces are reserved under a lock, so sends from one wallet do not
+        collide. For many calls at once, :meth:`send_transactions` reserves all nonces in one go.
+
+        Args:
+            wallet (LocalAccount): Sending account.
+            address (str): Contract address.
+            signature (str): Canonical function signature, e.g. ``"approve(address,uint256)"``.
+            args (tuple): Function arguments.
+            value (int): Amount of native token to send, in wei.
+            gas (Optional[int]): Gas limit. Estimated (plus ``GAS_ESTIMATE_MARGIN``) when not given.
+            **kwargs: Forwarded to :meth:`send_transactions` (``wait_for_inclusion``, ``tx_timeout``,
+                ``poll_latency``).
+
+        Returns:
+            Optional[str]: The transaction hash, or ``None`` if sending failed.
+        """
+        try:
+            to = abi.checksum_address(address)
+            data = abi.encode_call(signature, args)
+            if gas is None:
+                estimate = await self.web3.eth.estimate_gas(
+                    {"from": wallet.address, "to": to, "data": data, "value": value}
+                )
+                gas = int(estimate * GAS_ESTIMATE_MARGIN)
+        except Exception as e:
+            self._log(stdlogging.ERROR, "Preparing %s call failed: %s", signature, e)
+            return None
+        (tx_hash,) = await self.send_transactions(
+            wallet, [{"to": to, "data": data, "value": value, "gas": gas}], **kwargs
+        )
+        return tx_hash
+
+    async def estimate_block_time(self, sample: int = 10) -> Optional[float]:
+        """Async counterpart of :meth:`hetu.hetu.Hetutensor.estimate_block_time`. Computed once and cached."""
+        if self._block_time is None:
+            try:
+                latest = await self.web3.eth.get_block("latest")
+                first = await self.web3.eth.get_block(max(latest.number - sample, 0))
+                if latest.number > first.number:
+                    self._block_time = (latest.timestamp - first.timestamp) / (
+                        latest.number - first.number
+                    )
+            except _RPC_ERRORS as e:
+                self._log(stdlogging.ERROR, "Estimating block time failed: %s", e)
+        return self._block_time
+
+    async def default_poll_latency(self) -> float:
+        """Receipt poll interval matched to the chain: half a block, at least 0.25s (``DEFAULT_POLL_LATENCY`` if unknown)."""
+        block_time = await self.estimate_block_time()
+        return max(0.25, block_time / 2) if block_time else DEFAULT_POLL_LATENCY
+
+    async def wait_for_transaction_receipts(
+        self,
+        tx_hashes: list[str],
+        timeout: float = 120.0,
+        poll_latency: Optional[float] = None,
+        max_poll_latency: Optional[float] = None,
+    ) -> dict[str, Optional[dict]]:
+        """
+        Waits until the given transactions are mined, polling all pending receipts with one JSON-RPC batch per
+        interval instead of one poller per transaction.
+
+        Args:
+            tx_hashes (list[str]): Hashes of the submitted transactions.
+            timeout (float): Maximum time to wait in seconds.
+            poll_latency (Optional[float]): Initial delay between polls in seconds, backed off exponentially. Defaults
+                to :meth:`default_poll_latency`.
+            max_poll_latency (Optional[float]): Upper bound of the delay between polls. Defaults to
+                ``max(poll_latency, 2.0)``.
+
+        Returns:
+            dict[str, Optional[dict]]: ``status`` and ``blockNumber`` per ``0x`` prefixed transaction hash, ``None`` if
+                it was not mined in time.
+        """
+        if poll_latency is None:
+            poll_latency = await self.default_poll_latency()
+        if max_poll_latency is None:
+            max_poll_latency = max(poll_latency, 2.0)
+        pending = [self._tx_hash_hex(tx_hash) for tx_hash in tx_hashes]
+        receipts: dict[str, Optional[dict]] = {}
+        deadline = time.monotonic() + timeout
+        delay = poll_latency
+        while pending:
+            try:
+                if len(pending) == 1:
+                    responses = [
+                        await self.web3.provider.make_request(
+                            "eth_getTransactionReceipt", [pending[0]]
+                        )
+                    ]
+                else:
+                    responses = await self.web3.provider.make_batch_request(
+                        [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in pending]
+                    )
+                    if not isinstance(responses, list):
+                        raise ValueError(f"JSON-RPC batch rejected: {responses}")
+            except _RPC_ERRORS as e:
+                self._log(stdlogging.ERROR, "Receipt lookup failed: %s", e)
+                responses = []
+            for tx_hash, response in zip(pending, responses):
+                raw = response.get("result")
+                if raw:
+                    receipts[tx_hash] = {
+                        "status": int(raw["status"], 16),
+                        "blockNumber": int(raw["blockNumber"], 16),
+                    }
+            pending = [tx_hash for tx_hash in pending if tx_hash not in receipts]
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_poll_latency)
+        receipts.update({tx_hash: None for tx_hash in pending})
+        return receipts
+
+    @_rpc("web3.eth.wait_for_transaction_receipt", default=None)
+    async def wait_for_transaction_receipt(
+        self, tx_hash: str, timeout: float = 120.0, poll_latency: Optional[float] = None
+    ) -> Optional[dict]:
+        """
+        Waits until ``tx_hash`` is mined and returns its receipt, ``None`` on timeout or error. Polls every
+        :meth:`default_poll_latency` seconds unless ``poll_latency`` is given.
+        """
+        if poll_latency is None:
+            poll_latency = await self.default_poll_latency()
+        receipt = await self.web3.eth.wait_for_transaction_receipt(
+            tx_hash, timeout=timeout, poll_latency=poll_latency
+        )
+        return dict(receipt)
+
     # ===================== EVM/ETH Mock Extrinsics =====================
 
     async def add_stake(self, *args, **kwargs):
@@ -183,8 +897,16 @@ class AsyncHetutensor(HetutensorMixin):
     async def swap_stake(self, *args, **kwargs):
         return True
 
-    async def transfer(self, *args, **kwargs):
-        return True
+    async def transfer(self, wallet, dest: str, amount: Balance, **kwargs):
+        """Sends a raw ETH transaction using web3 (needs wallet private key)."""
+        (tx_hash,) = await self.send_transactions(
+            wallet,
+            [{"to": dest, "value": int(amount), "gas": kwargs.get("gas", 21000)}],
+            wait_for_inclusion=kwargs.get("wait_for_inclusion", False),
+            tx_timeout=kwargs.get("tx_timeout", 120.0),
+            poll_latency=kwargs.get("poll_latency"),
+        )
+        return tx_hash is not None
 
     async def transfer_stake(self, *args, **kwargs):
         return True
@@ -7,10 +7,10 @@ import copy
 import inspect
 import threading
 import time
-import traceback
 import typing
 import uuid
 import warnings
+from collections import OrderedDict
 from inspect import signature, Signature, Parameter
 from typing import Any, Awaitable, Callable, Optional, Tuple
 
@@ -43,8 +43,15 @@ from hetu.stream import StreamingSynapse
 from hetu.synapse import Synapse, TerminalInfo
 from hetu.threadpool import PriorityThreadPoolExecutor
 from hetu.utils import networking, Certificate
-from hetu.utils.axon_utils import allowed_nonce_window_ns, calculate_diff_seconds
+from hetu.utils.axon_utils import (
+    MAX_SESSION_TOKEN_TTL,
+    MAX_VERIFIED_AUTH_TOKENS,
+    allowed_nonce_window_ns,
+    calculate_diff_seconds,
+    session_token_message,
+)
 from hetu.utils.btlogging import logging
+from hetu.utils.btlogging.format import TRACE_LEVEL_NUM
 
 # Just for annotation checker
 if typing.TYPE_CHECKING:
@@ -378,6 +385,8 @@ class Axon:
             max_workers=self._config.axon.max_workers
         )
         self.nonces: dict[str, int] = {}
+        # Session tokens that already passed signature recovery, mapped to their expiry. Bounded LRU.
+        self.verified_auth_tokens: OrderedDict[str, int] = OrderedDict()
 
         # Request default functions.
         self.forward_class_types: dict[str, list[Signature]] = {}
@@ -999,12 +1008,63 @@ class Axon:
                     raise Exception(
                         f"Signature mismatch: recovered address {recovered_address} does not match claimed address {synapse.dendrite.hotkey}"
                     )
+            elif synapse.dendrite.auth_token:
+                self._verify_auth_token(synapse.dendrite)
 
             # Success
             self.nonces[endpoint_key] = synapse.dendrite.nonce  # type: ignore
         else:
             raise SynapseDendriteNoneException(synapse=synapse)
 
+    def _verify_auth_token(self, dendrite: "TerminalInfo"):
+        """
+        Verifies a dendrite session token. The signature is recovered once per token; later requests carrying the same
+        token only have their expiry checked. Up to ``MAX_VERIFIED_AUTH_TOKENS`` verified tokens are remembered, least
+        recently used first out.
+
+        Args:
+            dendrite (hetu.synapse.TerminalInfo): The dendrite terminal info carrying ``auth_token``.
+
+        Raises:
+            Exception: If the token is malformed, expired, too long-lived, or not signed by the claimed hotkey for this
+                axon.
+        """
+        token = dendrite.auth_token
+        # The token is only valid for the uuid and hotkey it was signed for.
+        cache_key = f"{dendrite.hotkey}:{dendrite.uuid}:{token}"
+        now = int(time.time())
+        expiry = self.verified_auth_tokens.get(cache_key)
+        if expiry is None:
+            try:
+                expiry_str, signature = token.split(".", 1)  # type: ignore
+                expiry = int(expiry_str)
+            except ValueError:
+                raise Exception("Malformed session token")
+            if expiry <= now:
+                raise Exception("Session token expired")
+            if expiry - now > MAX_SESSION_TOKEN_TTL:
+                raise Exception("Session token lifetime exceeds the allowed maximum")
+            # The signed message names this axon, so a token issued for another axon does not verify here.
+            message = session_token_message(dendrite.uuid, dendrite.hotkey, self.wallet.address, expiry)  # type: ignore
+            try:
+                recovered_address = Account.recover_message(
+                    encode_defunct(text=message), signature=signature
+                )
+            except Exception as e:
+                raise Exception(f"Session token recovery failed: {e}")
+            if recovered_address.lower() != dendrite.hotkey.lower():  # type: ignore
+                raise Exception(
+                    f"Session token mismatch: recovered address {recovered_address} does not match claimed address {dendrite.hotkey}"
+                )
+            self.verified_auth_tokens[cache_key] = expiry
+            while len(self.verified_auth_tokens) > MAX_VERIFIED_AUTH_TOKENS:
+                self.verified_auth_tokens.popitem(last=False)
+        elif expiry <= now:
+            del self.verified_auth_tokens[cache_key]
+            raise Exception("Session token expired")
+        else:
+            self.verified_auth_tokens.move_to_end(cache_key)
+
 
 def create_error_response(synapse: "Synapse") -> "JSONResponse":
     """Creates an error response based on the provided synapse object.
@@ -1054,7 +1114,8 @@ def log_and_handle_error(
 
         logging.trace(f"Forward handled exception: {exception}")
     else:
-        logging.trace(f"Forward exception: {traceback.format_exc()}")
+        # exc_info defers formatting the traceback until a TRACE handler emits the record.
+        logging.trace("Forward exception", exc_info=exception)
 
     if synapse.axon is None:
         synapse.axon = TerminalInfo()
@@ -1175,14 +1236,15 @@ class AxonMiddleware(BaseHTTPMiddleware):
                 raise
 
             # Logs the start of the request processing
-            if synapse.dendrite is not None:
-                logging.trace(
-                    f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port} | 200 | Success "
-                )
-            else:
-                logging.trace(
-                    f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
-                )
+            if logging.isEnabledFor(TRACE_LEVEL_NUM):
+                if synapse.dendrite is not None:
+                    logging.trace(
+                        f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port} | 200 | Success "
+                    )
+                else:
+                    logging.trace(
+                        f"axon     | <-- | {request.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
+                    )
 
             # Call the blacklist function
             await self.blacklist(synapse)
@@ -1219,18 +1281,19 @@ class AxonMiddleware(BaseHTTPMiddleware):
         finally:
             # Log the details of the processed synapse, including total size, name, hotkey, IP, port,
             # status code, and status message, using the debug level of the logger.
-            if synapse.dendrite is not None and synapse.axon is not None:
-                logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
-                )
-            elif synapse.axon is not None:
-                logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
-                )
-            else:
-                logging.trace(
-                    f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
-                )
+            if logging.isEnabledFor(TRACE_LEVEL_NUM):
+                if synapse.dendrite is not None and synapse.axon is not None:
+                    logging.trace(
+                        f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | {synapse.dendrite.hotkey} | {synapse.dendrite.ip}:{synapse.dendrite.port}  | {synapse.axon.status_code} | {synapse.axon.status_message}"
+                    )
+                elif synapse.axon is not None:
+                    logging.trace(
+                        f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | {synapse.axon.status_code} | {synapse.axon.status_message}"
+                    )
+                else:
+                    logging.trace(
+                        f"axon     | --> | {response.headers.get('content-length', -1)} B | {synapse.name} | None | None | 200 | Success "
+                    )
 
             # Return the response to the requester.
             return response
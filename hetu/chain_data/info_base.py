@@ -1,12 +1,12 @@
 from dataclasses import dataclass
-from typing import Any, TypeVar
+from typing import Any, Sequence, TypeVar
 
 from hetu.errors import HetuRequestException
 
 T = TypeVar("T", bound="InfoBase")
 
 
-@dataclass
+@dataclass(slots=True)
 class InfoBase:
     """Base dataclass for info objects."""
 
@@ -26,3 +26,16 @@ class InfoBase:
     @classmethod
     def _from_dict(cls, decoded: dict) -> T:
         return cls(**decoded)
+
+    @classmethod
+    def from_tuple(cls, values: Sequence[Any]) -> T:
+        """
+        Builds the object from an ABI decoded tuple whose items follow the dataclass field order.
+
+        Avoids materialising an intermediate dict per row when decoding contract results.
+        """
+        return cls(*values)
+
+    @classmethod
+    def list_from_tuples(cls, rows: list[Sequence[Any]]) -> list[T]:
+        return [cls(*row) for row in rows]
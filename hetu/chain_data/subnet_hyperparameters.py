@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from hetu.chain_data.info_base import InfoBase
 
 
-@dataclass
+@dataclass(slots=True)
 class SubnetHyperparameters(InfoBase):
     """
     This class represents the hyperparameters for a subnet.
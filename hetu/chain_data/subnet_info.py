@@ -7,7 +7,7 @@ from hetu.utils import u16_normalized_float
 from hetu.utils.balance import Balance
 
 
-@dataclass
+@dataclass(slots=True)
 class SubnetInfo(InfoBase):
     """Dataclass for subnet info."""
 
@@ -7,7 +7,8 @@ Defines HetuClient for interacting with the hetu blockchain (cosmos-sdk + EVM).
 """
 
 from web3 import Web3
-import requests
+
+from hetu.utils.networking import get_http_session
 
 class HetuClient:
     """
@@ -22,14 +23,19 @@ class HetuClient:
         """
         self.rpc_url = rpc_url
         self.evm_rpc_url = evm_rpc_url
-        self.web3 = Web3(Web3.HTTPProvider(evm_rpc_url))
+        self._session = get_http_session()
+        self.web3 = Web3(
+            Web3.HTTPProvider(
+                evm_rpc_url, session=self._session, request_kwargs={"timeout": 10}
+            )
+        )
 
     def get_cosmos_status(self):
         """
         Get status from the Cosmos RPC endpoint.
         :return: JSON response from /status endpoint
         """
-        resp = requests.get(f"{self.rpc_url}/status")
+        resp = self._session.get(f"{self.rpc_url}/status")
         resp.raise_for_status()
         return resp.json()
 
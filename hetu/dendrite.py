@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 import asyncio
+import concurrent.futures
+import functools
+import hashlib
+import os
 import time
 import uuid
 import warnings
+import weakref
+from collections import OrderedDict
 from typing import Any, AsyncGenerator, Optional, Union, Type
 
 import aiohttp
@@ -16,7 +22,9 @@ from hetu.settings import version_as_int
 from hetu.stream import StreamingSynapse
 from hetu.synapse import Synapse, TerminalInfo
 from hetu.utils import networking
+from hetu.utils.axon_utils import MAX_SESSION_TOKEN_TTL, session_token_message
 from hetu.utils.btlogging import logging
+from hetu.utils.btlogging.format import TRACE_LEVEL_NUM
 from hetu.utils.registration import torch, use_torch
 
 DENDRITE_ERROR_MAPPING: dict[Type[Exception], tuple] = {
@@ -31,6 +39,48 @@ DENDRITE_ERROR_MAPPING: dict[Type[Exception], tuple] = {
 }
 DENDRITE_DEFAULT_ERROR = ("422", "Failed to parse response")
 
+# Request signing (keccak + secp256k1) is CPU bound. Running it here keeps the event loop free to drive the other
+# in-flight requests of a fan-out.
+_SIGNING_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=min(8, os.cpu_count() or 4), thread_name_prefix="dendrite_sign"
+)
+
+# Upper bound on the number of responses kept by the opt-in ``cache_ttl`` response cache.
+RESPONSE_CACHE_MAX_SIZE = 512
+
+# Close tasks scheduled by ``_close_unclosed_session``.
+_CLOSING_SESSIONS: set[asyncio.Task] = set()
+
+
+@functools.lru_cache(maxsize=32)
+def _client_timeout(total: float) -> aiohttp.ClientTimeout:
+    """Returns a shared, immutable ``aiohttp.ClientTimeout`` for the given total timeout."""
+    return aiohttp.ClientTimeout(total=total)
+
+
+def _close_unclosed_session(session: aiohttp.ClientSession):
+    """
+    Finalizer for a dendrite that was garbage-collected without closing its session.
+
+    Registered via ``weakref.finalize`` so it only references the session, never the dendrite itself.
+    """
+    if session.closed:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        # Running a loop from a finalizer is unsafe and closing needs the loop that owns the session, so leave the
+        # connector to aiohttp's own cleanup.
+        logging.debug(
+            "A Dendrite session was unable to be closed during garbage-collection of the Dendrite object. This "
+            "usually indicates that you were not using the async context manager."
+        )
+        return
+    task = loop.create_task(session.close())
+    # Keep a reference until the task is done, the event loop only holds weak references to tasks.
+    _CLOSING_SESSIONS.add(task)
+    task.add_done_callback(_CLOSING_SESSIONS.discard)
+
 
 def event_loop_is_running():
     try:
@@ -72,6 +122,8 @@ class DendriteMixin:
             contains streaming response chunks before finally yielding the filled Synapse as the final element.
         preprocess_synapse_for_request(self, target_axon_info, synapse, timeout=12.0) -> Synapse: Preprocesses the
             synapse for making a request, including building headers and signing.
+        apreprocess_synapse_for_request(self, target_axon_info, synapse, timeout=12.0) -> Synapse: Same as
+            ``preprocess_synapse_for_request``, but signs in a worker thread instead of on the event loop.
         process_server_response(self, server_response, json_response, local_synapse): Processes the server response,
             updates the local synapse state, and merges headers.
         close_session(self): Synchronously closes the internal aiohttp client session.
@@ -99,19 +151,27 @@ class DendriteMixin:
         d( hetu.axon.Axon, hetu.synapse.Synapse )
     """
 
-    def __init__(self, account: Optional[Account] = None):
+    def __init__(
+        self,
+        account: Optional[Account] = None,
+        session_token_ttl: Optional[float] = None,
+    ):
         """
         Initializes the Dendrite object, setting up essential properties.
 
         Args:
             account (Optional[Account]): The user's account used for signing messages. Defaults to ``None``, in which case a new
                 account is generated and used.
+            session_token_ttl (Optional[float]): If set, requests carry a session token signed once per axon per this
+                many seconds instead of a per-request signature, so repeated queries to the same axons cost one
+                signature per axon per window. The token does not cover the request body or nonce. Capped at ``MAX_SESSION_TOKEN_TTL``. Defaults to
+                ``None`` (sign every request).
         """
         # Initialize the parent class
         super(DendriteMixin, self).__init__()
 
-        # Unique identifier for the instance
-        self.uuid = str(uuid.uuid1())
+        # Unique identifier for the instance. uuid4 avoids the MAC address lookup done by uuid1.
+        self.uuid = uuid.uuid4().hex
 
         # Get the external IP
         self.external_ip = networking.get_external_ip()
@@ -122,6 +182,15 @@ class DendriteMixin:
         self.synapse_history: list = []
 
         self._session: Optional[aiohttp.ClientSession] = None
+        self._session_finalizer: Optional[weakref.finalize] = None
+
+        self._session_token_ttl = (
+            min(session_token_ttl, MAX_SESSION_TOKEN_TTL) if session_token_ttl else None
+        )
+        # Session tokens per target axon hotkey, as ``(token, expiry)``.
+        self._auth_tokens: dict[str, tuple[str, float]] = {}
+
+        self._response_cache: OrderedDict[tuple, tuple[float, Synapse]] = OrderedDict()
 
     @property
     async def session(self) -> aiohttp.ClientSession:
@@ -159,8 +228,18 @@ class DendriteMixin:
         """
         if self._session is None:
             self._session = aiohttp.ClientSession()
+            self._session_finalizer = weakref.finalize(
+                self, _close_unclosed_session, self._session
+            )
+            # Leave interpreter shutdown alone, the OS reclaims the sockets.
+            self._session_finalizer.atexit = False
         return self._session
 
+    def _detach_session_finalizer(self):
+        if self._session_finalizer is not None:
+            self._session_finalizer.detach()
+            self._session_finalizer = None
+
     def close_session(self, using_new_loop: bool = False):
         """
         Closes the internal `aiohttp <https://github.com/aio-libs/aiohttp>`_ client session synchronously.
@@ -193,6 +272,7 @@ class DendriteMixin:
             if using_new_loop:
                 loop.close()
             self._session = None
+        self._detach_session_finalizer()
 
     async def aclose_session(self):
         """
@@ -218,6 +298,38 @@ class DendriteMixin:
         if self._session:
             await self._session.close()
             self._session = None
+        self._detach_session_finalizer()
+
+    @staticmethod
+    def _response_cache_key(target_axon: "AxonInfo", synapse: "Synapse") -> Optional[tuple]:
+        """
+        Builds the response cache key from the target axon and a hash of the full request payload, ignoring the
+        per-request terminal headers (nonce, signature, ...). Returns ``None`` when the payload cannot be serialized,
+        in which case the request bypasses the cache.
+        """
+        try:
+            payload = synapse.model_dump_json(exclude={"dendrite", "axon", "computed_body_hash"})
+        except Exception:
+            return None
+        digest = hashlib.sha256(payload.encode()).hexdigest()
+        return target_axon.ip, target_axon.port, synapse.__class__.__name__, digest
+
+    def _get_cached_response(self, key: tuple, ttl: float) -> Optional["Synapse"]:
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, cached = entry
+        if time.monotonic() - stored_at >= ttl:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return cached.model_copy(deep=True)
+
+    def _put_cached_response(self, key: tuple, synapse: "Synapse"):
+        self._response_cache[key] = (time.monotonic(), synapse.model_copy(deep=True))
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > RESPONSE_CACHE_MAX_SIZE:
+            self._response_cache.popitem(last=False)
 
     def _get_endpoint_url(self, target_axon, request_name):
         """
@@ -324,7 +436,8 @@ class DendriteMixin:
         Args:
             synapse (hetu.synapse.Synapse): The synapse object representing the request being sent.
         """
-        if synapse.axon is not None:
+        # get_total_size walks the whole synapse, so only pay for it when TRACE is on.
+        if synapse.axon is not None and logging.isEnabledFor(TRACE_LEVEL_NUM):
             logging.trace(
                 f"dendrite | --> | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | 0 | Success"
             )
@@ -340,7 +453,11 @@ class DendriteMixin:
         Args:
             synapse (hetu.synapse.Synapse): The synapse object representing the received response.
         """
-        if synapse.axon is not None and synapse.dendrite is not None:
+        if (
+            synapse.axon is not None
+            and synapse.dendrite is not None
+            and logging.isEnabledFor(TRACE_LEVEL_NUM)
+        ):
             logging.trace(
                 f"dendrite | <-- | {synapse.get_total_size()} B | {synapse.name} | {synapse.axon.hotkey} | {synapse.axon.ip}:{str(synapse.axon.port)} | {synapse.dendrite.status_code} | {synapse.dendrite.status_message}"
             )
@@ -402,6 +519,7 @@ class DendriteMixin:
         deserialize: bool = True,
         run_async: bool = True,
         streaming: bool = False,
+        cache_ttl: float = 0.0,
     ) -> list[Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]]:
         """
         Asynchronously sends requests to one or multiple Axons and collates their responses.
@@ -450,18 +568,14 @@ class DendriteMixin:
             run_async (bool): If ``True``, sends requests concurrently. Otherwise, sends requests sequentially.
                 Defaults to ``True``.
             streaming (bool): Indicates if the response is expected to be in streaming format. Defaults to ``False``.
+            cache_ttl (float): If positive, successful non-streaming responses are reused for identical requests
+                to the same axon for this many seconds. Defaults to ``0.0`` (no caching).
 
         Returns:
             Union[AsyncGenerator, hetu.synapse.Synapse, list[hetu.synapse.Synapse]]: If a single
                 `Axon` is targeted, returns its response.
             If multiple Axons are targeted, returns a list of their responses.
         """
-        is_list = True
-        # If a single axon is provided, wrap it in a list for uniform processing
-        if not isinstance(axons, list):
-            is_list = False
-            axons = [axons]
-
         # Check if synapse is an instance of the StreamingSynapse class or if streaming flag is set.
         is_streaming_subclass = issubclass(synapse.__class__, StreamingSynapse)
         if streaming != is_streaming_subclass:
@@ -470,6 +584,23 @@ class DendriteMixin:
             )
         streaming = is_streaming_subclass or streaming
 
+        # Fast path for a single axon: skip the closures, list wrapping and gather.
+        if not isinstance(axons, list):
+            if streaming:
+                return self.call_stream(  # type: ignore
+                    target_axon=axons,
+                    synapse=synapse.model_copy(),  # type: ignore
+                    timeout=timeout,
+                    deserialize=deserialize,
+                )
+            return await self.call(  # type: ignore
+                target_axon=axons,
+                synapse=synapse.model_copy(),  # type: ignore
+                timeout=timeout,
+                deserialize=deserialize,
+                cache_ttl=cache_ttl,
+            )
+
         async def query_all_axons(
             is_stream: bool,
         ) -> Union["AsyncGenerator[Any, Any]", "Synapse", "StreamingSynapse"]:
@@ -525,6 +656,7 @@ class DendriteMixin:
                         synapse=synapse.model_copy(),  # type: ignore
                         timeout=timeout,
                         deserialize=deserialize,
+                        cache_ttl=cache_ttl,
                     )
 
             # If run_async flag is False, get responses one by one.
@@ -538,9 +670,7 @@ class DendriteMixin:
             )  # type: ignore
 
         # Get responses for all axons.
-        responses = await query_all_axons(streaming)
-        # Return the single response if only one axon was targeted, else return all responses
-        return responses[0] if len(responses) == 1 and not is_list else responses  # type: ignore
+        return await query_all_axons(streaming)  # type: ignore
 
     async def call(
         self,
@@ -548,6 +678,7 @@ class DendriteMixin:
         synapse: "Synapse" = Synapse(),
         timeout: float = 12.0,
         deserialize: bool = True,
+        cache_ttl: float = 0.0,
     ) -> "Synapse":
         """
         Asynchronously sends a request to a specified Axon and processes the response.
@@ -562,6 +693,8 @@ class DendriteMixin:
                 :func:`Synapse` instance.
             timeout (float): Maximum duration to wait for a response from the Axon in seconds. Defaults to ``12.0``.
             deserialize (bool): Determines if the received response should be deserialized. Defaults to ``True``.
+            cache_ttl (float): If positive, a successful response to an identical request sent to the same Axon within
+                the last ``cache_ttl`` seconds is returned without hitting the network. Defaults to ``0.0``.
 
         Returns:
             hetu.synapse.Synapse: The Synapse object, updated with the response data from the Axon.
@@ -577,8 +710,18 @@ class DendriteMixin:
         request_name = synapse.__class__.__name__
         url = self._get_endpoint_url(target_axon, request_name=request_name)
 
+        cache_key = None
+        if cache_ttl > 0:
+            cache_key = self._response_cache_key(target_axon, synapse)
+        if cache_key is not None:
+            cached = self._get_cached_response(cache_key, cache_ttl)
+            if cached is not None:
+                return cached.deserialize() if deserialize else cached
+
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)
+        synapse = await self.apreprocess_synapse_for_request(
+            target_axon, synapse, timeout
+        )
 
         try:
             # Log outgoing request
@@ -589,7 +732,7 @@ class DendriteMixin:
                 url=url,
                 headers=synapse.to_headers(),
                 json=synapse.model_dump(),
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                timeout=_client_timeout(timeout),
             ) as response:
                 # Extract the JSON response from the server
                 json_response = await response.json()
@@ -599,6 +742,9 @@ class DendriteMixin:
             # Set process time and log the response
             synapse.dendrite.process_time = str(time.time() - start_time)  # type: ignore
 
+            if cache_key is not None and synapse.dendrite.status_code == 200:  # type: ignore
+                self._put_cached_response(cache_key, synapse)
+
         except Exception as e:
             synapse = self.process_error_message(synapse, request_name, e)
 
@@ -648,15 +794,12 @@ class DendriteMixin:
 
         # Build request endpoint from the synapse class
         request_name = synapse.__class__.__name__
-        endpoint = (
-            f"0.0.0.0:{str(target_axon.port)}"
-            if target_axon.ip == str(self.external_ip)
-            else f"{target_axon.ip}:{str(target_axon.port)}"
-        )
-        url = f"http://{endpoint}/{request_name}"
+        url = self._get_endpoint_url(target_axon, request_name=request_name)
 
         # Preprocess synapse for making a request
-        synapse = self.preprocess_synapse_for_request(target_axon, synapse, timeout)  # type: ignore
+        synapse = await self.apreprocess_synapse_for_request(  # type: ignore
+            target_axon, synapse, timeout
+        )
 
         try:
             # Log outgoing request
@@ -667,7 +810,7 @@ class DendriteMixin:
                 url,
                 headers=synapse.to_headers(),
                 json=synapse.model_dump(),
-                timeout=aiohttp.ClientTimeout(total=timeout),
+                timeout=_client_timeout(timeout),
             ) as response:
                 # Use synapse subclass' process_streaming_response method to yield the response chunks
                 async for chunk in synapse.process_streaming_response(response):  # type: ignore
@@ -713,6 +856,49 @@ class DendriteMixin:
         Returns:
             hetu.synapse.Synapse: The preprocessed synapse.
         """
+        synapse = self._build_request_headers(target_axon_info, synapse, timeout)
+        if self._session_token_ttl:
+            synapse.dendrite.auth_token = self._get_auth_token(synapse.axon.hotkey)  # type: ignore
+        else:
+            synapse.dendrite.signature = self._sign_request(synapse)  # type: ignore
+        return synapse
+
+    async def apreprocess_synapse_for_request(
+        self,
+        target_axon_info: "AxonInfo",
+        synapse: "Synapse",
+        timeout: float = 12.0,
+    ) -> "Synapse":
+        """
+        Asynchronous counterpart of :func:`preprocess_synapse_for_request`.
+
+        Headers are built on the event loop, while the signature is computed in a worker thread so that signing for
+        one axon overlaps with in-flight HTTP I/O for the others.
+
+        Args:
+            target_axon_info (hetu.chain_data.axon_info.AxonInfo): The target axon information.
+            synapse (hetu.synapse.Synapse): The synapse object to be preprocessed.
+            timeout (float): The request timeout duration in seconds. Defaults to ``12.0`` seconds.
+
+        Returns:
+            hetu.synapse.Synapse: The preprocessed synapse.
+        """
+        synapse = self._build_request_headers(target_axon_info, synapse, timeout)
+        if self._session_token_ttl:
+            synapse.dendrite.auth_token = self._get_auth_token(synapse.axon.hotkey)  # type: ignore
+        else:
+            synapse.dendrite.signature = await asyncio.get_running_loop().run_in_executor(  # type: ignore
+                _SIGNING_EXECUTOR, self._sign_request, synapse
+            )
+        return synapse
+
+    def _build_request_headers(
+        self,
+        target_axon_info: "AxonInfo",
+        synapse: "Synapse",
+        timeout: float,
+    ) -> "Synapse":
+        """Fills the dendrite and axon terminal info and the body hash that the signature covers."""
         # Set the timeout for the synapse
         synapse.timeout = timeout
         synapse.dendrite = TerminalInfo(
@@ -736,13 +922,33 @@ class DendriteMixin:
             computed_hash = synapse.body_hash
             synapse = synapse.model_copy(update={"computed_body_hash": computed_hash})
 
-        # Sign the request using the dendrite, axon info, and the synapse body hash
+        return synapse
+
+    def _sign_request(self, synapse: "Synapse") -> str:
+        """Signs the dendrite, axon info, and the synapse body hash. Safe to run from a worker thread."""
         message = f"{synapse.dendrite.nonce}.{synapse.dendrite.hotkey}.{synapse.axon.hotkey}.{synapse.dendrite.uuid}.{synapse.computed_body_hash}"
         signable = encode_defunct(text=message)
         signature = self.account.sign_message(signable).signature
-        synapse.dendrite.signature = f"0x{signature.hex()}"
+        return f"0x{signature.hex()}"
 
-        return synapse
+    def _get_auth_token(self, axon_hotkey: str) -> str:
+        """
+        Returns the current session token for an axon, signing a new one when the previous one is about to expire.
+
+        The token has the form ``<expiry>.<signature>`` where the signature covers ``uuid.hotkey.axon_hotkey.expiry``.
+        The axon verifies it once and then only checks the expiry.
+        """
+        now = time.time()
+        token, expiry = self._auth_tokens.get(axon_hotkey, ("", 0.0))
+        if now > expiry - 5:
+            expiry = int(now + self._session_token_ttl)  # type: ignore
+            message = session_token_message(self.uuid, self.account.address, axon_hotkey, expiry)
+            signature = self.account.sign_message(encode_defunct(text=message)).signature
+            token = f"{expiry}.0x{signature.hex()}"
+            # Drop the tokens of other axons that have expired before remembering the new one.
+            self._auth_tokens = {k: v for k, v in self._auth_tokens.items() if v[1] > now}
+            self._auth_tokens[axon_hotkey] = (token, float(expiry))
+        return token
 
     def process_server_response(
         self,
@@ -767,15 +973,17 @@ class DendriteMixin:
             # If the response is successful, overwrite local synapse state with
             # server's state only if the protocol allows mutation. To prevent overwrites,
             # the protocol must set Frozen = True
-            server_synapse = local_synapse.__class__(**json_response)
-            for key in local_synapse.model_dump().keys():
-                try:
-                    # Set the attribute in the local synapse from the corresponding
-                    # attribute in the server synapse
-                    setattr(local_synapse, key, getattr(server_synapse, key))
-                except Exception:
-                    # Ignore errors during attribute setting
-                    pass
+            synapse_class = type(local_synapse)
+            server_synapse = synapse_class.model_validate(json_response)
+            # A frozen model rejects every assignment, as setattr would.
+            if not synapse_class.model_config.get("frozen", False):
+                for key, field in synapse_class.model_fields.items():
+                    if field.frozen:
+                        continue
+                    # The value was just validated by model_validate, so skip validate_assignment but keep
+                    # model_fields_set in step with what setattr would record.
+                    object.__setattr__(local_synapse, key, server_synapse.__dict__[key])
+                    local_synapse.__pydantic_fields_set__.add(key)
         else:
             # If the server responded with an error, update the local synapse state
             if local_synapse.axon is None:
@@ -865,42 +1073,20 @@ class DendriteMixin:
         """
         await self.aclose_session()
 
-    def __del__(self):
-        """
-        Dendrite destructor.
-
-        This method is invoked when the Dendrite instance is about to be destroyed. The destructor ensures that the
-        aiohttp client session is closed before the instance is fully destroyed, releasing any remaining resources.
-
-        Note:
-            Relying on the destructor for cleanup can be unpredictable. It is recommended to explicitly close sessions
-                using the provided methods or the ``async with`` context manager.
-
-        Usage::
-
-            dendrite = ht.Dendrite()
-            # ... some operations ...
-            del dendrite  # This will implicitly invoke the __del__ method and close the session.
-        """
-        try:
-            self.close_session()
-        except RuntimeError:
-            if self._session:
-                logging.debug(
-                    "A Dendrite session was unable to be closed during garbage-collection of the Dendrite object. This "
-                    "usually indicates that you were not using the async context manager."
-                )
-
 
 # For back-compatibility with torch
 BaseModel: Union["torch.nn.Module", object] = torch.nn.Module if use_torch() else object
 
 
 class Dendrite(DendriteMixin, BaseModel):  # type: ignore
-    def __init__(self, account: Optional[Account] = None):
+    def __init__(
+        self,
+        account: Optional[Account] = None,
+        session_token_ttl: Optional[float] = None,
+    ):
         if use_torch():
             torch.nn.Module.__init__(self)
-        DendriteMixin.__init__(self, account)
+        DendriteMixin.__init__(self, account, session_token_ttl)
 
 
 if not use_torch():
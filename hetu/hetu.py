@@ -1,6 +1,20 @@
-from typing import TYPE_CHECKING, Any, Optional, Union
+import concurrent.futures
+import functools
+import itertools
+import logging as stdlogging
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Union
+import grpc
+import numpy as np
 from numpy.typing import NDArray
+from requests.exceptions import (
+    ConnectionError as RequestsConnectionError,
+    RequestException,
+    Timeout,
+)
 from web3 import Web3, HTTPProvider
+from web3.exceptions import Web3Exception
 
 from hetu.axon import Axon
 from hetu.chain_data import (
@@ -11,15 +25,67 @@ from hetu.chain_data import (
     NeuronInfo,
     NeuronInfoLite,
 )
+from hetu.chain_data.info_base import InfoBase
 from hetu.config import Config
-from hetu.settings import NETWORKS, NETWORK_MAP
+from hetu import settings
+from hetu.settings import DEFAULT_POLL_LATENCY, GAS_ESTIMATE_MARGIN, NETWORKS, NETWORK_MAP
 from hetu.metagraph import Metagraph
 from hetu.types import HetutensorMixin
 from hetu.utils.balance import Balance
 from hetu.utils.btlogging import logging
+from hetu.utils import abi, multicall as mc
+from hetu.utils.abi import checksum_address
+from hetu.utils.caching import DiskCache, TTLLRUCache, ttl_lru_cache
+from hetu.utils.networking import get_http_session
 
 if TYPE_CHECKING:
     from eth_account.account import Account  # ETH wallet
+    from eth_account.signers.local import LocalAccount  # Account instance holding a private key
+
+
+# How long a gas limit estimated for a (contract, call data, value) is reused by sends that opt in.
+GAS_ESTIMATE_TTL = 300.0
+
+# Errors worth retrying when ``retry_forever`` is set: the endpoint is unreachable or slow, not the request invalid.
+_TRANSIENT_RPC_ERRORS = (RequestsConnectionError, Timeout, ConnectionError, TimeoutError)
+# Errors an RPC can legitimately fail with (node errors, transport, malformed responses). Anything else is a bug
+# in the caller or in this module and is left to propagate.
+_RPC_ERRORS = (Web3Exception, RequestException, OSError, ValueError)
+
+
+def _rpc(action: str, default: Any = None):
+    """
+    Wraps a Hetutensor RPC method: logs RPC failures (when ``log_verbose``) and returns ``default`` instead of
+    raising. Errors outside ``_RPC_ERRORS`` (e.g. a ``TypeError`` from bad arguments) propagate.
+
+    With ``retry_forever`` set, transient connection errors are retried with exponential backoff (capped at 5s)
+    instead of returning ``default``. ``default`` may be a callable producing a fresh value.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(self, *args, **kwargs):
+            attempt = 0
+            while True:
+                try:
+                    return fn(self, *args, **kwargs)
+                except _TRANSIENT_RPC_ERRORS as e:
+                    if not self.retry_forever:
+                        self._log(stdlogging.ERROR, "%s%s failed: %s", action, args, e)
+                        break
+                    self._log(
+                        stdlogging.WARNING, "%s%s failed, retrying: %s", action, args, e
+                    )
+                    time.sleep(min(2**attempt * 0.1, 5))
+                    attempt += 1
+                except _RPC_ERRORS as e:
+                    self._log(stdlogging.ERROR, "%s%s failed: %s", action, args, e)
+                    break
+            return default() if callable(default) else default
+
+        return wrapper
+
+    return decorator
 
 
 class Hetutensor(HetutensorMixin):
@@ -42,15 +108,37 @@ class Hetutensor(HetutensorMixin):
         self.network = network or "local"
         self._config = config
         self.log_verbose = log_verbose
+        self.retry_forever = retry_forever
         if network in NETWORKS:
             self.chain_endpoint = NETWORK_MAP[network]
         else:
             self.chain_endpoint = "http://localhost:8545"  # Default mock endpoint
-        self.web3 = Web3(HTTPProvider(self.chain_endpoint))
-        if self.log_verbose:
-            logging.info(
-                f"Connected to {self.network} network at {self.chain_endpoint} (EVM mock mode)."
+        # One keep-alive session for all RPCs instead of a new TCP/TLS connection per request.
+        self._session = get_http_session()
+        self.web3 = Web3(
+            HTTPProvider(
+                self.chain_endpoint,
+                session=self._session,
+                request_kwargs={"timeout": 10},
             )
+        )
+        self._chain_id: Optional[int] = None
+        self._fee_params: Optional[tuple[float, dict]] = None  # (fetched_at, fee fields)
+        self._nonces: dict[str, int] = {}
+        self._nonce_lock = threading.Lock()
+        self._block_time: Optional[float] = None
+        self._contracts: dict[tuple[str, int], tuple[list, Any]] = {}
+        self._gas_limits = TTLLRUCache(maxsize=1024)
+        self._grpc_stubs: dict[str, tuple[grpc.Channel, Any]] = {}
+        self._disk_cache: Optional[DiskCache] = (
+            DiskCache(settings.CALL_CACHE_PATH) if settings.CALL_CACHE_PATH else None
+        )
+        self._log(
+            stdlogging.INFO,
+            "Using %s network at %s (JSON-RPC).",
+            self.network,
+            self.chain_endpoint,
+        )
 
     def __enter__(self):
         return self
@@ -59,8 +147,13 @@ class Hetutensor(HetutensorMixin):
         self.close()
 
     def close(self):
-        """Closes the client connection (mock, does nothing)."""
-        pass
+        """Closes the pooled HTTP connections to the chain endpoint and any gRPC channels."""
+        self._session.close()
+        for channel, _ in self._grpc_stubs.values():
+            channel.close()
+        self._grpc_stubs.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.close()
 
     # ===================== EVM/ETH Mock Query Methods =====================
 
@@ -110,26 +203,16 @@ class Hetutensor(HetutensorMixin):
     def block(self) -> int:
         return self.get_current_block()
 
+    @_rpc("web3.eth.block_number", default=0)
     def get_current_block(self) -> int:
         """Returns the latest block number using web3."""
-        try:
-            return self.web3.eth.block_number
-        except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.block_number failed: {e}")
-            return 0
+        return self.web3.eth.block_number
 
+    @_rpc("web3.eth.get_block", default="0x" + "0" * 64)
     def get_block_hash(self, block: Optional[int] = None) -> str:
         """Returns the block hash for a given block number using web3."""
-        try:
-            if block is None:
-                block = self.get_current_block()
-            block_obj = self.web3.eth.get_block(block)
-            return block_obj.hash.hex()
-        except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.get_block({block}) failed: {e}")
-            return "0x" + "0" * 64
+        block_obj = self.web3.eth.get_block(self._block_identifier(block))
+        return block_obj.hash.hex()
 
     def determine_block_hash(self, block: Optional[int]) -> Optional[str]:
         """Mock: Returns None for block hash determination."""
@@ -143,21 +226,71 @@ class Hetutensor(HetutensorMixin):
     def get_all_subnets_info(self, block: Optional[int] = None) -> list[SubnetInfo]:
         return []
 
+    @_rpc("web3.eth.get_balance", default=lambda: Balance(0))
     def get_balance(self, address: str, block: Optional[int] = None) -> Balance:
         """Returns the ETH balance for an address using web3."""
-        try:
-            block_param = block if block is not None else 'latest'
-            balance_wei = self.web3.eth.get_balance(address, block_identifier=block_param)
-            return Balance(balance_wei)
-        except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.get_balance({address}) failed: {e}")
-            return Balance(0)
+        block_param = self._block_identifier(block)
+        balance_wei = self.web3.eth.get_balance(
+            checksum_address(address), block_identifier=block_param
+        )
+        return Balance(balance_wei)
 
     def get_balances(
         self, *addresses: str, block: Optional[int] = None
     ) -> dict[str, Balance]:
-        return {address: Balance(0) for address in addresses}
+        """Returns the ETH balances of several addresses in a single Multicall3 round-trip."""
+        if not addresses:
+            return {}
+        results = self.multicall(
+            [(mc.MULTICALL3_ADDRESS, mc.encode_get_eth_balance(a)) for a in addresses],
+            block=block,
+        )
+        if results is not None:
+            return {
+                address: Balance(mc.decode_uint256(data) or 0)
+                for address, data in zip(addresses, results)
+            }
+        # Multicall3 is not available on this chain: one JSON-RPC batch of eth_getBalance instead.
+        block_id = self._rpc_block_identifier(block)
+        try:
+            responses = self.batch_request(
+                [("eth_getBalance", [address, block_id]) for address in addresses]
+            )
+            return {
+                address: Balance(int(response.get("result") or "0x0", 16))
+                for address, response in zip(addresses, responses)
+            }
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.ERROR, "Batched eth_getBalance failed: %s", e)
+            return {address: self.get_balance(address, block=block) for address in addresses}
+
+    def get_token_balances(
+        self, token: str, *owners: str, block: Optional[int] = None
+    ) -> dict[str, Optional[int]]:
+        """
+        Returns the ERC-20 ``balanceOf`` of several owners of ``token`` (e.g. WHETU) in a single Multicall3 round-trip.
+
+        Args:
+            token (str): ERC-20 contract address.
+            *owners (str): Addresses to query.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            dict[str, Optional[int]]: Raw token amount per owner, ``None`` where the read failed.
+        """
+        if not owners:
+            return {}
+        reads = [
+            (token, "balanceOf(address)", (checksum_address(owner),), ("uint256",))
+            for owner in owners
+        ]
+        results = self.multiread(reads, block=block)
+        if results is None:
+            results = self.read_contracts(reads, block=block)
+        return {
+            owner: None if result is None else result[0]
+            for owner, result in zip(owners, results)
+        }
 
     def get_hyperparameter(
         self, param_name: str, netuid: int, block: Optional[int] = None
@@ -353,67 +486,788 @@ class Hetutensor(HetutensorMixin):
     ) -> bool:
         return True
 
-    def transfer(self, wallet: "Account", dest: str, amount: Balance, **kwargs) -> bool:
-        """Sends a raw ETH transaction using web3 (needs wallet private key)."""
+    # ===================== EVM/ETH Transaction Helpers =====================
+
+    @property
+    def chain_id(self) -> int:
+        """The chain id of the endpoint, fetched once (it never changes)."""
+        if self._chain_id is None:
+            self._chain_id = self.web3.eth.chain_id
+        return self._chain_id
+
+    def get_fee_params(self, max_age: float = 3.0) -> dict:
+        """
+        Returns the fee fields for a new transaction, reusing values fetched less than ``max_age`` seconds ago.
+
+        EIP-1559 ``maxFeePerGas``/``maxPriorityFeePerGas`` are derived from one ``eth_feeHistory`` call. Chains without
+        a base fee (or without ``eth_feeHistory``) get a legacy ``gasPrice``.
+        """
+        now = time.monotonic()
+        if self._fee_params is None or now - self._fee_params[0] > max_age:
+            params = None
+            try:
+                params = self._fee_params_from_history(
+                    self.web3.eth.fee_history(
+                        self._FEE_HISTORY_BLOCKS, "latest", [self._FEE_HISTORY_PERCENTILE]
+                    )
+                )
+            except _RPC_ERRORS as e:
+                self._log(stdlogging.INFO, "eth_feeHistory unavailable, using gasPrice: %s", e)
+            if params is None:
+                params = {"gasPrice": self.web3.eth.gas_price}
+            self._fee_params = (now, params)
+        return self._fee_params[1]
+
+    def next_nonce(self, address: str) -> int:
+        """
+        Returns the nonce to use for the next transaction sent from ``address``.
+
+        The pending nonce is fetched once and then incremented locally. Call :meth:`reset_nonce` when a send fails
+        so that the next call re-syncs with the node.
+        """
+        with self._nonce_lock:
+            nonce = self._nonces.get(address)
+            if nonce is None:
+                nonce = self.web3.eth.get_transaction_count(address, "pending")
+            self._nonces[address] = nonce + 1
+            return nonce
+
+    def _prefetch_tx_params(
+        self, address: str, estimate_tx: Optional[dict] = None, max_age: float = 3.0
+    ) -> Optional[int]:
+        """
+        Warms the chain id, fee and nonce caches for ``address`` with a single JSON-RPC batch, optionally
+        estimating the gas of ``estimate_tx`` in the same batch.
+
+        Only the values that are missing or stale are requested. If batching fails the caches are simply left cold and
+        filled one by one by the regular getters.
+
+        Returns:
+            Optional[int]: The gas estimate of ``estimate_tx`` if it was requested and succeeded.
+        """
+        now = time.monotonic()
+        requests_: list[tuple[str, list]] = []
+        if self._chain_id is None:
+            requests_.append(("eth_chainId", []))
+        if self._fee_params is None or now - self._fee_params[0] > max_age:
+            requests_.append(
+                (
+                    "eth_feeHistory",
+                    [hex(self._FEE_HISTORY_BLOCKS), "latest", [self._FEE_HISTORY_PERCENTILE]],
+                )
+            )
+        if address not in self._nonces:
+            requests_.append(("eth_getTransactionCount", [address, "pending"]))
+        if estimate_tx is not None:
+            requests_.append(("eth_estimateGas", [estimate_tx]))
+        if not requests_:
+            return None
+        if len(requests_) == 1 and estimate_tx is None:
+            # A lone value is fetched by its regular getter; a batch would not save anything.
+            return None
+        try:
+            responses = self.batch_request(requests_)
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.ERROR, "Batched transaction parameter fetch failed: %s", e)
+            return None
+        estimate = None
+        for (method, _), response in zip(requests_, responses):
+            result = response.get("result")
+            if result is None:
+                continue
+            if method == "eth_feeHistory":
+                # A chain without a base fee is left to get_fee_params for the gasPrice fallback.
+                params = self._fee_params_from_history(result)
+                if params is not None:
+                    self._fee_params = (now, params)
+                continue
+            value = int(result, 16)
+            if method == "eth_chainId":
+                self._chain_id = value
+            elif method == "eth_getTransactionCount":
+                with self._nonce_lock:
+                    self._nonces.setdefault(address, value)
+            else:
+                estimate = value
+        return estimate
+
+    def reset_nonce(self, address: str):
+        """Forgets the locally tracked nonce of ``address``."""
+        with self._nonce_lock:
+            self._nonces.pop(address, None)
+
+    def send_transaction(
+        self,
+        wallet: "LocalAccount",
+        to: str,
+        data: str = "0x",
+        value: int = 0,
+        gas: Optional[int] = None,
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        Builds, signs and sends a transaction from ``wallet``.
+
+        The nonce, fees, chain id and, when ``gas`` is not given, the gas estimate are fetched together in one
+        JSON-RPC batch on a cold path and served from the local caches afterwards. An estimated gas limit gets a
+        ``GAS_ESTIMATE_MARGIN`` safety margin. With ``reuse_gas_estimate=True`` it is reused for ``GAS_ESTIMATE_TTL``
+        seconds by later sends with exactly the same destination, call data and value; only opt in where the gas used
+        does not depend on changing contract state. Fees are EIP-1559 (type 2) unless the chain has no base fee.
+
+        Args:
+            wallet (LocalAccount): Sending account, e.g. from ``Account.create()`` or ``Account.from_key()``.
+            to (str): Destination address.
+            data (str): Hex encoded call data.
+            value (int): Amount of wei to send.
+            gas (Optional[int]): Gas limit. Estimated when ``None``.
+            **kwargs: ``wait_for_inclusion``, ``tx_timeout`` and ``poll_latency`` for waiting on the receipt;
+                ``reuse_gas_estimate=True`` to reuse an earlier estimate for identical call data.
+
+        Returns:
+            Optional[str]: The ``0x`` prefixed transaction hash, or ``None`` if sending (or, when waiting, the
+                transaction itself) failed.
+        """
         try:
-            nonce = self.web3.eth.get_transaction_count(wallet.address)
+            # Checksummed through the shared cache: lowercase input is accepted and each address is hashed once.
+            to = checksum_address(to)
+            reuse_gas = gas is None and kwargs.get("reuse_gas_estimate", False)
+            gas_key = (to, data, value)
+            if reuse_gas:
+                gas = self._gas_limits.get(gas_key)
+            estimate_tx = None
+            if gas is None:
+                estimate_tx = {"from": wallet.address, "to": to, "data": data, "value": hex(value)}
+            estimate = self._prefetch_tx_params(wallet.address, estimate_tx)
+            if gas is None:
+                if estimate is None:
+                    estimate = self.web3.eth.estimate_gas(
+                        {"from": wallet.address, "to": to, "data": data, "value": value}
+                    )
+                gas = int(estimate * GAS_ESTIMATE_MARGIN)
+                if reuse_gas:
+                    self._gas_limits.set(gas_key, gas, GAS_ESTIMATE_TTL)
             tx = {
-                'to': dest,
-                'value': int(amount),
-                'gas': kwargs.get('gas', 21000),
-                'gasPrice': self.web3.eth.gas_price,
-                'nonce': nonce,
-                'chainId': self.web3.eth.chain_id,
+                'to': to,
+                'value': value,
+                'data': data,
+                'gas': gas,
+                **self.get_fee_params(),
+                'nonce': self.next_nonce(wallet.address),
+                'chainId': self.chain_id,
             }
-            signed = self.web3.eth.account.sign_transaction(tx, wallet.key)
-            tx_hash = self.web3.eth.send_raw_transaction(signed.rawTransaction)
-            if self.log_verbose:
-                logging.info(f"Sent tx: {tx_hash.hex()}")
-            return True
+            # A LocalAccount already holds the parsed private key; signing through
+            # web3.eth.account would rebuild it from the raw key bytes on every send.
+            signed = wallet.sign_transaction(tx)
+            tx_hash = Web3.to_hex(self.web3.eth.send_raw_transaction(signed.raw_transaction))
+            self.invalidate_call_cache()
+            self._log(stdlogging.INFO, "Sent tx: %s", tx_hash)
         except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3 transfer failed: {e}")
-            return False
+            self.reset_nonce(wallet.address)
+            self.invalidate_fee_params()
+            self._log(stdlogging.ERROR, "web3 send_transaction failed: %s", e)
+            return None
+        if kwargs.get("wait_for_inclusion"):
+            receipt = self.wait_for_transaction_receipt(
+                tx_hash,
+                timeout=kwargs.get("tx_timeout", 120.0),
+                poll_latency=kwargs.get("poll_latency"),
+                full=False,
+            )
+            if not receipt or receipt.get("status") != 1:
+                return None
+        return tx_hash
 
-    def get_transaction_receipt(self, tx_hash: str) -> Optional[dict]:
+    def send_transactions(
+        self,
+        wallet: "LocalAccount",
+        txs: list[dict],
+        wait_for_inclusion: bool = False,
+        tx_timeout: float = 120.0,
+        poll_latency: Optional[float] = None,
+    ) -> list[Optional[str]]:
+        """
+        Sends several independent transactions from ``wallet`` back to back and, optionally, waits for all of them at
+        once.
+
+        Nonces are handed out locally, so each send is a single ``eth_sendRawTransaction`` and the transactions can
+        land in the same block. Waiting polls all receipts together (see :meth:`wait_for_transaction_receipts`)
+        instead of blocking on each transaction in turn. See :class:`hetu.async_hetutensor.AsyncHetutensor` for
+        submissions that also overlap on the wire.
+
+        Args:
+            wallet (LocalAccount): Sending account.
+            txs (list[dict]): Keyword arguments of :meth:`send_transaction` per transaction (``to``, ``data``,
+                ``value``, ``gas``).
+            wait_for_inclusion (bool): Wait for all receipts and report reverted transactions as ``None``.
+            tx_timeout (float): Maximum time to wait for all receipts in seconds.
+            poll_latency (Optional[float]): Initial delay between receipt polls in seconds.
+
+        Returns:
+            list[Optional[str]]: The transaction hash of each submission, ``None`` where it failed.
+        """
+        tx_hashes = [self.send_transaction(wallet, **tx) for tx in txs]
+        if not wait_for_inclusion:
+            return tx_hashes
+        receipts = self.wait_for_transaction_receipts(
+            [tx_hash for tx_hash in tx_hashes if tx_hash],
+            timeout=tx_timeout,
+            poll_latency=poll_latency,
+            full=False,
+        )
+        return [
+            tx_hash if tx_hash and (receipts.get(tx_hash) or {}).get("status") == 1 else None
+            for tx_hash in tx_hashes
+        ]
+
+    def send_contract_transaction(
+        self,
+        wallet: "LocalAccount",
+        address: str,
+        signature: str,
+        args: tuple = (),
+        **kwargs,
+    ) -> Optional[str]:
+        """
+        Calls a state changing contract function without building a web3 ``Contract``.
+
+        The call data is encoded once with the cached selector of ``signature`` and reused for both the gas estimate
+        and the signed transaction; nothing goes through ``build_transaction``. Struct arguments are passed as tuples,
+        e.g. ``[(dest, weight), ...]`` for a ``(address,uint256)[]`` parameter.
+
+        Args:
+            wallet (LocalAccount): Sending account.
+            address (str): Contract address.
+            signature (str): Canonical function signature, e.g. ``"setWeights(uint16,(address,uint256)[])"``.
+            args (tuple): Function arguments.
+            **kwargs: Forwarded to :meth:`send_transaction` (``value``, ``gas``, ``wait_for_inclusion``, ...).
+
+        Returns:
+            Optional[str]: The transaction hash, or ``None`` if sending failed.
+        """
         try:
-            receipt = self.web3.eth.get_transaction_receipt(tx_hash)
-            return dict(receipt) if receipt else None
+            data = abi.encode_call(signature, args)
         except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.get_transaction_receipt({tx_hash}) failed: {e}")
+            self._log(stdlogging.ERROR, "Encoding %s call failed: %s", signature, e)
             return None
+        return self.send_transaction(wallet, address, data=data, **kwargs)
 
-    def get_transaction_count(self, address: str, block: Optional[int] = None) -> int:
+    def transfer(self, wallet: "LocalAccount", dest: str, amount: Balance, **kwargs) -> bool:
+        """Sends a raw ETH transaction using web3 (needs wallet private key)."""
+        return (
+            self.send_transaction(
+                wallet, dest, value=int(amount), gas=kwargs.pop("gas", 21000), **kwargs
+            )
+            is not None
+        )
+
+    @_rpc("web3.eth.get_transaction_receipt", default=None)
+    def get_transaction_receipt(self, tx_hash: str) -> Optional[dict]:
+        receipt = self.web3.eth.get_transaction_receipt(tx_hash)
+        return dict(receipt) if receipt else None
+
+    def estimate_block_time(self, sample: int = 10) -> Optional[float]:
+        """
+        Estimates the average block time in seconds from the last ``sample`` blocks. Computed once and cached.
+
+        Returns:
+            Optional[float]: The block time, or ``None`` if it could not be determined.
+        """
+        if self._block_time is None:
+            try:
+                latest = self.web3.eth.get_block("latest")
+                first = self.web3.eth.get_block(max(latest.number - sample, 0))
+                if latest.number > first.number:
+                    self._block_time = (latest.timestamp - first.timestamp) / (
+                        latest.number - first.number
+                    )
+            except _RPC_ERRORS as e:
+                self._log(stdlogging.ERROR, "Estimating block time failed: %s", e)
+        return self._block_time
+
+    def default_poll_latency(self) -> float:
+        """Receipt poll interval matched to the chain: half a block, at least 0.25s (``DEFAULT_POLL_LATENCY`` if unknown)."""
+        block_time = self.estimate_block_time()
+        return max(0.25, block_time / 2) if block_time else DEFAULT_POLL_LATENCY
+
+    def wait_for_transaction_receipts(
+        self,
+        tx_hashes: list[Union[str, bytes]],
+        timeout: float = 120.0,
+        poll_latency: Optional[float] = None,
+        max_poll_latency: Optional[float] = None,
+        full: bool = True,
+    ) -> dict[str, Optional[dict]]:
+        """
+        Waits until the given transactions are mined and returns their receipts.
+
+        Polling starts at ``poll_latency`` and backs off exponentially up to ``max_poll_latency``. While several
+        transactions are pending, each poll is a single JSON-RPC batch of ``eth_getTransactionReceipt`` calls.
+
+        Args:
+            tx_hashes (list[Union[str, bytes]]): Hashes of the submitted transactions.
+            timeout (float): Maximum time to wait in seconds.
+            poll_latency (Optional[float]): Initial delay between polls in seconds. Defaults to
+                :meth:`default_poll_latency`.
+            max_poll_latency (Optional[float]): Upper bound of the delay between polls in seconds. Defaults to
+                ``max(poll_latency, 2.0)``.
+            full (bool): Return web3 formatted receipts. With ``False`` only ``status`` and ``blockNumber`` are parsed
+                from the polled JSON, skipping a second fetch and the decoding of the logs.
+
+        Returns:
+            dict[str, Optional[dict]]: Receipt per ``0x`` prefixed transaction hash, ``None`` if it was not mined in
+                time.
+        """
+        if poll_latency is None:
+            poll_latency = self.default_poll_latency()
+        if max_poll_latency is None:
+            max_poll_latency = max(poll_latency, 2.0)
+        pending = [self._tx_hash_hex(tx_hash) for tx_hash in tx_hashes]
+        receipts: dict[str, Optional[dict]] = {}
+        deadline = time.monotonic() + timeout
+        delay = poll_latency
+        while pending:
+            for tx_hash, raw in self._poll_receipts(pending).items():
+                if full:
+                    receipt = self.get_transaction_receipt(tx_hash)
+                else:
+                    receipt = {
+                        "status": int(raw["status"], 16),
+                        "blockNumber": int(raw["blockNumber"], 16),
+                    }
+                if receipt:
+                    receipts[tx_hash] = receipt
+            pending = [tx_hash for tx_hash in pending if tx_hash not in receipts]
+            remaining = deadline - time.monotonic()
+            if not pending or remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, max_poll_latency)
+        receipts.update({tx_hash: None for tx_hash in pending})
+        return receipts
+
+    def wait_for_transaction_receipt(
+        self,
+        tx_hash: Union[str, bytes],
+        timeout: float = 120.0,
+        poll_latency: Optional[float] = None,
+        full: bool = True,
+    ) -> Optional[dict]:
+        """Waits until ``tx_hash`` is mined and returns its receipt, ``None`` on timeout."""
+        receipts = self.wait_for_transaction_receipts(
+            [tx_hash], timeout, poll_latency, full=full
+        )
+        return next(iter(receipts.values()))
+
+    def _poll_receipts(self, tx_hashes: list[str]) -> dict[str, dict]:
+        """
+        Returns the raw JSON receipts of the mined transactions among ``tx_hashes``.
+
+        Uses the raw provider so that pending transactions come back as ``null`` instead of raising, and several
+        hashes are looked up in one batch request.
+        """
         try:
-            block_param = block if block is not None else 'latest'
-            return self.web3.eth.get_transaction_count(address, block_identifier=block_param)
-        except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.get_transaction_count({address}) failed: {e}")
-            return 0
+            if len(tx_hashes) == 1:
+                responses = [
+                    self.web3.provider.make_request(
+                        "eth_getTransactionReceipt", [tx_hashes[0]]
+                    )
+                ]
+            else:
+                responses = self.batch_request(
+                    [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in tx_hashes]
+                )
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.ERROR, "Receipt lookup failed: %s", e)
+            return {}
+        return {
+            tx_hash: response["result"]
+            for tx_hash, response in zip(tx_hashes, responses)
+            if response.get("result")
+        }
+
+    @_rpc("web3.eth.get_transaction_count", default=0)
+    def get_transaction_count(self, address: str, block: Optional[int] = None) -> int:
+        block_param = self._block_identifier(block)
+        return self.web3.eth.get_transaction_count(
+            checksum_address(address), block_identifier=block_param
+        )
 
+    @ttl_lru_cache(maxsize=4096, ttl=float("inf"), latest_ttl=2.0)
+    @_rpc("web3.eth.call", default=None)
     def call(self, to: str, data: str, block: Optional[int] = None) -> Optional[str]:
+        """
+        Executes a read-only ``eth_call``.
+
+        Results are cached per ``(to, data, block)``: reads against ``latest`` for about a block, reads pinned to a
+        block until evicted, as historical state does not change. Use :meth:`invalidate_call_cache` after a state
+        changing transaction. When ``settings.CALL_CACHE_PATH`` is set, block-pinned results are also persisted there
+        and survive restarts.
+        """
+        disk_key = None
+        if block is not None and self._disk_cache is not None:
+            disk_key = self._disk_call_key(to, data, block)
+            cached = self._disk_cache.get(disk_key)
+            if cached is not None:
+                return cached
+        tx = {'to': checksum_address(to), 'data': data}
+        block_param = self._block_identifier(block)
+        result = self.web3.eth.call(tx, block_identifier=block_param)
+        result = result.hex() if isinstance(result, bytes) else result
+        if disk_key is not None:
+            self._disk_cache.set(disk_key, result)
+        return result
+
+    def multicall(
+        self,
+        calls: list[tuple[str, str]],
+        block: Optional[int] = None,
+        allow_failure: bool = True,
+    ) -> Optional[list[Optional[bytes]]]:
+        """
+        Executes several read-only calls in one ``eth_call`` through the Multicall3 contract.
+
+        All calls see the same block state, and only one RPC round-trip is made.
+
+        Args:
+            calls (list[tuple[str, str]]): ``(to, data)`` pairs, where ``data`` is hex encoded call data.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+            allow_failure (bool): If ``False`` any reverting call fails the whole batch.
+
+        Returns:
+            Optional[list[Optional[bytes]]]: The raw return data of each call, or ``None`` for calls that
+                reverted. ``None`` if the multicall itself failed.
+        """
+        if not calls:
+            return []
+        result = self.call(
+            mc.MULTICALL3_ADDRESS, mc.encode_aggregate3(calls, allow_failure), block
+        )
+        if result is None:
+            return None
         try:
-            tx = {'to': to, 'data': data}
-            block_param = block if block is not None else 'latest'
-            result = self.web3.eth.call(tx, block_identifier=block_param)
-            return result.hex() if isinstance(result, bytes) else result
+            return [data if ok else None for ok, data in mc.decode_aggregate3(result)]
         except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.call({to}, {data}) failed: {e}")
+            self._log(stdlogging.ERROR, "Multicall3 result decoding failed: %s", e)
             return None
 
-    def estimate_gas(self, to: str, data: str, value: int = 0, from_addr: Optional[str] = None) -> int:
+    def batch_request(
+        self, requests: list[tuple[str, list]], batch_size: int = 25
+    ) -> list[dict]:
+        """
+        Sends independent JSON-RPC requests as batches of at most ``batch_size`` and returns the raw responses in
+        request order.
+
+        Each batch is one HTTP round-trip. Very large batches are split because nodes process a batch serially and
+        many providers cap or throttle batch size.
+
+        Args:
+            requests (list[tuple[str, list]]): ``(method, params)`` per request.
+            batch_size (int): Maximum number of requests per HTTP call.
+
+        Returns:
+            list[dict]: One JSON-RPC response object per request, holding either ``result`` or ``error``.
+
+        Raises:
+            ValueError: If the node rejects batching altogether. Transport errors propagate as raised by web3.
+        """
+        responses: list[dict] = []
+        for start in range(0, len(requests), batch_size):
+            chunk = self.web3.provider.make_batch_request(requests[start : start + batch_size])
+            if not isinstance(chunk, list):
+                # A node without batch support answers with a single error object.
+                raise ValueError(f"JSON-RPC batch rejected: {chunk}")
+            responses.extend(chunk)
+        return responses
+
+    def batch_call(
+        self, calls: list[tuple[str, str]], block: Optional[int] = None
+    ) -> Optional[list[Optional[bytes]]]:
+        """
+        Executes several read-only calls as a single JSON-RPC batch of ``eth_call`` requests.
+
+        Fallback for chains without Multicall3: still one HTTP round-trip, but each call is a separate request on the
+        node, so a reverting call only fails its own entry.
+
+        Args:
+            calls (list[tuple[str, str]]): ``(to, data)`` pairs, where ``data`` is hex encoded call data.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            Optional[list[Optional[bytes]]]: The raw return data of each call, ``None`` for failed calls. ``None`` if
+                the batch request itself failed (e.g. the node disables batching).
+        """
+        if not calls:
+            return []
+        block_id = self._rpc_block_identifier(block)
         try:
-            tx = {'to': to, 'data': data, 'value': value}
-            if from_addr:
-                tx['from'] = from_addr
-            return self.web3.eth.estimate_gas(tx)
+            responses = self.batch_request(
+                [("eth_call", [{"to": to, "data": data}, block_id]) for to, data in calls]
+            )
+        except _RPC_ERRORS as e:
+            self._log(stdlogging.ERROR, "Batched eth_call failed: %s", e)
+            return None
+        return [
+            mc.to_bytes(response["result"]) if response.get("result") is not None else None
+            for response in responses
+        ]
+
+    def read_contract(
+        self,
+        address: str,
+        signature: str,
+        args: tuple = (),
+        output_types: tuple[str, ...] = (),
+        block: Optional[int] = None,
+    ) -> Optional[tuple]:
+        """
+        Calls a contract view function through a raw ``eth_call``, without building a web3 ``Contract``.
+
+        The selector and argument types of ``signature`` are derived once and cached.
+
+        Args:
+            address (str): Contract address.
+            signature (str): Canonical function signature, e.g. ``"balanceOf(address)"``.
+            args (tuple): Function arguments.
+            output_types (tuple[str, ...]): ABI types of the return values, e.g. ``("uint256",)``.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            Optional[tuple]: The decoded return values, or ``None`` if the call failed.
+        """
+        result = self.call(address, abi.encode_call(signature, args), block)
+        if result is None:
+            return None
+        try:
+            return abi.decode_result(output_types, mc.to_bytes(result))
         except Exception as e:
-            if self.log_verbose:
-                logging.error(f"web3.eth.estimate_gas({to}) failed: {e}")
-            return 0
+            self._log(
+                stdlogging.ERROR, "Decoding %s result from %s failed: %s", signature, address, e
+            )
+            return None
+
+    def read_info(
+        self,
+        address: str,
+        signature: str,
+        args: tuple,
+        output_types: tuple[str, ...],
+        info_class: type[InfoBase],
+        block: Optional[int] = None,
+    ) -> Optional[InfoBase]:
+        """
+        Reads a struct-returning view function and decodes it straight into a ``chain_data`` dataclass.
+
+        Skips the web3 ``Contract`` wrapper: the call data is built from the cached selector, the result is decoded
+        with ``output_types`` and passed positionally to ``info_class``. A single tuple output type (a Solidity
+        struct) is unwrapped first.
+
+        Args:
+            address (str): Contract address.
+            signature (str): Canonical function signature.
+            args (tuple): Function arguments.
+            output_types (tuple[str, ...]): ABI types of the return values, in ``info_class`` field order.
+            info_class (type[InfoBase]): Dataclass to build.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            Optional[InfoBase]: The decoded object, or ``None`` if the call failed.
+        """
+        result = self.read_contract(address, signature, args, output_types, block)
+        if result is None:
+            return None
+        if len(output_types) == 1 and output_types[0].startswith("("):
+            result = result[0]
+        return info_class.from_tuple(result)
+
+    def multiread(
+        self,
+        reads: list[tuple[str, str, tuple, tuple[str, ...]]],
+        block: Optional[int] = None,
+    ) -> Optional[list[Optional[tuple]]]:
+        """
+        Executes several contract view calls in a single Multicall3 ``eth_call`` and decodes their results. Falls back
+        to a JSON-RPC batch (:meth:`batch_call`) when Multicall3 is not deployed.
+
+        Dependent reads (for instance a total count and a validator count) are returned from the same block in one
+        round-trip instead of one RPC each.
+
+        Args:
+            reads (list[tuple[str, str, tuple, tuple[str, ...]]]): ``(address, signature, args, output_types)`` per read.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            Optional[list[Optional[tuple]]]: The decoded results in order, ``None`` for reverted reads. ``None`` if
+                neither Multicall3 nor a JSON-RPC batch is available, in which case see :meth:`read_contracts`.
+        """
+        calls = [
+            (address, abi.encode_call(signature, args))
+            for address, signature, args, _ in reads
+        ]
+        results = self.multicall(calls, block=block)
+        if results is None:
+            results = self.batch_call(calls, block=block)
+        if results is None:
+            return None
+        decoded: list[Optional[tuple]] = []
+        for (address, signature, _, output_types), data in zip(reads, results):
+            try:
+                decoded.append(
+                    None if data is None else abi.decode_result(output_types, data)
+                )
+            except Exception as e:
+                self._log(
+                    stdlogging.ERROR, "Decoding %s result from %s failed: %s", signature, address, e
+                )
+                decoded.append(None)
+        return decoded
+
+    def iter_multiread(
+        self,
+        reads: Iterable[tuple[str, str, tuple, tuple[str, ...]]],
+        page_size: int = 500,
+        block: Optional[int] = None,
+    ) -> Iterator[Optional[tuple]]:
+        """
+        Lazily executes ``reads`` as :meth:`multiread` pages of ``page_size`` and yields each decoded result in order,
+        ``None`` for reads that reverted.
+
+        Memory stays bounded by one page however many reads there are, and ``reads`` may itself be a generator.
+        Without a pinned ``block`` each page runs against the block that is latest when it is sent.
+
+        Args:
+            reads (Iterable[tuple[str, str, tuple, tuple[str, ...]]]): ``(address, signature, args, output_types)``
+                per read.
+            page_size (int): Number of reads per Multicall3 request.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Yields:
+            Optional[tuple]: The decoded result of each read.
+        """
+        for page in itertools.batched(reads, page_size):
+            page = list(page)
+            results = self.multiread(page, block=block)
+            if results is None:
+                results = self.read_contracts(page, block=block)
+            yield from results
+
+    def multiread_columns(
+        self,
+        address: str,
+        signature: str,
+        args_list: list[tuple],
+        output_types: tuple[str, ...],
+        block: Optional[int] = None,
+    ) -> tuple[NDArray[np.bool_], list[NDArray]]:
+        """
+        Reads a view function for many arguments in one :meth:`multiread` and returns the results column-wise as numpy
+        arrays, ready for vectorised sums, sorting or filtering across all rows.
+
+        A function returning a struct of static fields can be read with the flattened field types, e.g.
+        ``("uint256", "uint256")`` for a ``(uint256,uint256)`` return value: both are encoded identically.
+
+        Args:
+            address (str): Contract address.
+            signature (str): Canonical function signature.
+            args_list (list[tuple]): Function arguments of each read.
+            output_types (tuple[str, ...]): ABI types of the return values.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            tuple[NDArray[np.bool_], list[NDArray]]: A mask of the reads that succeeded, and one array per output
+                (``int64`` where every value fits, ``object`` otherwise).
+        """
+        reads = [(address, signature, args, output_types) for args in args_list]
+        results = self.multiread(reads, block=block)
+        if results is None:
+            results = self.read_contracts(reads, block=block)
+        return self._results_to_columns(results, output_types)
+
+    def multiread_info(
+        self,
+        address: str,
+        signature: str,
+        args_list: list[tuple],
+        output_types: tuple[str, ...],
+        info_class: type[InfoBase],
+        block: Optional[int] = None,
+    ) -> list[InfoBase]:
+        """
+        Reads a struct-returning view function for many arguments in one :meth:`multiread` and decodes the results
+        into ``info_class`` objects.
+
+        Intended for sweeps over ids that may not exist (e.g. every netuid up to a total): a getter reverting for a
+        missing id just drops that entry, so no separate existence check is needed per id. The skipped ids are
+        reported in a single log line. Falls back to concurrent single reads (:meth:`read_contracts`) on providers
+        that support neither Multicall3 nor JSON-RPC batches.
+
+        Args:
+            address (str): Contract address.
+            signature (str): Canonical function signature.
+            args_list (list[tuple]): Function arguments of each read.
+            output_types (tuple[str, ...]): ABI types of the return values, in ``info_class`` field order.
+            info_class (type[InfoBase]): Dataclass to build.
+            block (Optional[int]): Block number to execute against. Defaults to ``latest``.
+
+        Returns:
+            list[InfoBase]: The decoded objects of the reads that succeeded, in order.
+        """
+        reads = [(address, signature, args, output_types) for args in args_list]
+        results = self.multiread(reads, block=block)
+        if results is None:
+            results = self.read_contracts(reads, block=block)
+        unwrap = len(output_types) == 1 and output_types[0].startswith("(")
+        infos = [
+            info_class.from_tuple(result[0] if unwrap else result)
+            for result in results
+            if result is not None
+        ]
+        if len(infos) < len(args_list):
+            self._log(
+                stdlogging.INFO,
+                "Skipped %d of %d %s reads that reverted",
+                len(args_list) - len(infos),
+                len(args_list),
+                signature,
+            )
+        return infos
+
+    def read_contracts(
+        self,
+        reads: list[tuple[str, str, tuple, tuple[str, ...]]],
+        block: Optional[int] = None,
+        max_workers: int = 16,
+    ) -> list[Optional[tuple]]:
+        """
+        Runs several :meth:`read_contract` calls concurrently and returns their results in order.
+
+        The reads are independent RPCs sharing the pooled HTTP session, so wall-clock time is roughly that of the
+        slowest read instead of the sum. Prefer :meth:`multicall` when Multicall3 is deployed on the chain.
+
+        Args:
+            reads (list[tuple[str, str, tuple, tuple[str, ...]]]): ``(address, signature, args, output_types)`` per read.
+            block (Optional[int]): Block number to execute all reads against. Defaults to ``latest``.
+            max_workers (int): Maximum number of concurrent RPCs.
+
+        Returns:
+            list[Optional[tuple]]: The decoded results, ``None`` for failed reads.
+        """
+        if not reads:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(reads))
+        ) as executor:
+            return list(
+                executor.map(
+                    lambda read: self.read_contract(*read, block=block), reads
+                )
+            )
+
+    @_rpc("web3.eth.estimate_gas", default=0)
+    def estimate_gas(self, to: str, data: str, value: int = 0, from_addr: Optional[str] = None) -> int:
+        tx = {'to': checksum_address(to), 'data': data, 'value': value}
+        if from_addr:
+            tx['from'] = checksum_address(from_addr)
+        return self.web3.eth.estimate_gas(tx)
 
     def query_raw_checkpoint_list(self, grpc_endpoint: str, request) -> object:
         """
@@ -424,10 +1278,26 @@ class Hetutensor(HetutensorMixin):
         Returns:
             QueryRawCheckpointListResponse protobuf message.
         """
-        import grpc
-        from hetu.cosmos.hetu.checkpointing.v1 import query_pb2_grpc
-
-        with grpc.insecure_channel(grpc_endpoint) as channel:
-            stub = query_pb2_grpc.QueryStub(channel)
-            response = stub.RawCheckpointList(request)
-            return response
+        return self._checkpoint_query_stub(grpc_endpoint).RawCheckpointList(request)
+
+    def _checkpoint_query_stub(self, grpc_endpoint: str):
+        """Returns a checkpointing ``QueryStub`` on a keep-alive channel, created once per endpoint."""
+        entry = self._grpc_stubs.get(grpc_endpoint)
+        if entry is None:
+            # Generated stubs pull in googleapis protos; keep them out of ``import hetu``.
+            from hetu.cosmos.hetu.checkpointing.v1 import query_pb2_grpc
+
+            channel = grpc.insecure_channel(
+                grpc_endpoint,
+                options=[
+                    ("grpc.keepalive_time_ms", 30000),
+                    ("grpc.http2.max_pings_without_data", 0),
+                ],
+            )
+            entry = self._grpc_stubs.setdefault(
+                grpc_endpoint, (channel, query_pb2_grpc.QueryStub(channel))
+            )
+            if entry[0] is not channel:
+                # Another thread connected first.
+                channel.close()
+        return entry[1]
@@ -79,6 +79,20 @@ RAO_SYMBOL: str = chr(0x03C1)
 # Pip address for versioning
 PIPADDRESS = "https://pypi.org/pypi/hetutensor/json"
 
+# Multicall3 aggregator contract, deployed at the same address on most EVM chains.
+MULTICALL3_ADDRESS = (
+    os.getenv("HETU_MULTICALL3_ADDRESS") or "0xcA11bde05977b3631167028862bE2a173976CA11"
+)
+
+# Optional SQLite file persisting block-pinned ``eth_call`` results across processes. Disabled when unset.
+CALL_CACHE_PATH = os.getenv("HETU_CALL_CACHE_PATH")
+
+# Receipt poll interval (seconds) used when the chain's block time cannot be determined.
+DEFAULT_POLL_LATENCY = 1.0
+
+# Safety margin applied to ``eth_estimateGas`` results when setting a transaction's gas limit.
+GAS_ESTIMATE_MARGIN = 1.25
+
 # Substrate chain block time (seconds).
 BLOCKTIME = 12
 
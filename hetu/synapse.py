@@ -14,6 +14,7 @@ from pydantic import (
 
 from hetu.utils import get_hash
 from hetu.utils.btlogging import logging
+from hetu.utils.btlogging.format import TRACE_LEVEL_NUM
 
 
 def get_size(obj: Any, seen: Optional[set] = None) -> int:
@@ -237,6 +238,15 @@ class TerminalInfo(BaseModel):
         frozen=False,
     )
 
+    # A time-windowed token signed once by the dendrite, sent instead of a per-request signature.
+    auth_token: Optional[str] = Field(
+        title="auth_token",
+        description="A session token of the form '<expiry>.<signature>' where the signature covers (uuid, hotkey, expiry)",
+        examples=["1700000060.0x0813029319030129u4120u10841824y0182u091u230912u"],
+        default=None,
+        frozen=False,
+    )
+
     # Extract the process time on this terminal side of call as a float
     _extract_process_time = field_validator("process_time", mode="before")(cast_float)
 
@@ -809,7 +819,8 @@ class Synapse(BaseModel):
                     continue
             else:
                 # setting this to warning fills up logs unnecessarily
-                logging.trace(f"Unexpected header key encountered: {key}")
+                if logging.isEnabledFor(TRACE_LEVEL_NUM):
+                    logging.trace(f"Unexpected header key encountered: {key}")
 
         # Assign the remaining known headers directly
         inputs_dict["timeout"] = headers.get("timeout", None)
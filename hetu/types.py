@@ -1,8 +1,14 @@
 from abc import ABC
 import argparse
-from typing import TypedDict, Optional
+import logging as stdlogging
+from typing import Any, TypedDict, Optional, Union
+
+import numpy as np
+from eth_utils import add_0x_prefix
+from numpy.typing import NDArray
 
 from hetu.utils import networking, Certificate
+from hetu.utils.abi import checksum_address
 from hetu.utils.btlogging import logging
 from hetu import settings
 from hetu.config import Config
@@ -14,6 +20,8 @@ class HetutensorMixin(ABC):
     network: str
     chain_endpoint: str
     log_verbose: bool
+    _contracts: dict[tuple[str, int], tuple[list, Any]]
+    _fee_params: Optional[tuple[float, dict]]
 
     def __str__(self):
         return f"Network: {self.network}, Chain: {self.chain_endpoint}"
@@ -21,17 +29,155 @@ class HetutensorMixin(ABC):
     def __repr__(self):
         return self.__str__()
 
+    def _log(self, level: int, msg: str, *args):
+        """Logs ``msg % args`` when ``log_verbose`` is set, formatting only if the level is enabled."""
+        if self.log_verbose and logging.isEnabledFor(level):
+            logging.log(level, msg, *args, stacklevel=2)
+
+    @staticmethod
+    def _block_identifier(block: Optional[int]) -> Union[int, str]:
+        """Maps an optional block number to a web3 ``block_identifier`` (``"latest"`` when ``None``)."""
+        return "latest" if block is None else block
+
+    def _rpc_block_identifier(self, block: Optional[int]) -> str:
+        """Block parameter for raw JSON-RPC requests, which expect a hex quantity rather than an int."""
+        block_id = self._block_identifier(block)
+        return hex(block_id) if isinstance(block_id, int) else block_id
+
+    @staticmethod
+    def _tx_hash_hex(tx_hash: Union[str, bytes]) -> str:
+        """Normalizes a transaction hash, raw bytes or a hex string, to the lowercase ``0x`` prefixed form."""
+        if isinstance(tx_hash, (bytes, bytearray)):
+            return "0x" + bytes(tx_hash).hex()
+        return add_0x_prefix(tx_hash.lower())
+
+    # ``eth_feeHistory`` window used to price EIP-1559 transactions: the last 5 blocks, median tip.
+    _FEE_HISTORY_BLOCKS = 5
+    _FEE_HISTORY_PERCENTILE = 50
+
+    @staticmethod
+    def _fee_params_from_history(history: dict) -> Optional[dict]:
+        """
+        Derives EIP-1559 fee fields from an ``eth_feeHistory`` result (raw hex or web3 decoded).
+
+        The max fee is twice the next block's base fee plus the median priority fee, which stays valid through several
+        full blocks of base fee increases. Returns ``None`` when the chain reports no base fee (no EIP-1559).
+        """
+
+        def to_int(value) -> int:
+            return int(value, 16) if isinstance(value, str) else int(value)
+
+        base_fees = history.get("baseFeePerGas") or []
+        base_fee = to_int(base_fees[-1]) if base_fees else 0
+        if not base_fee:
+            return None
+        tips = sorted(to_int(reward[0]) for reward in history.get("reward") or [] if reward)
+        tip = tips[len(tips) // 2] if tips else 0
+        return {"maxFeePerGas": 2 * base_fee + tip, "maxPriorityFeePerGas": tip, "type": 2}
+
+    def invalidate_call_cache(self, to: Optional[str] = None):
+        """
+        Drops cached latest-block ``call`` results, either all of them or only those for the contract ``to``.
+
+        Results pinned to a block number are kept: a transaction cannot change historical state.
+        """
+        cache = type(self).call.cache(self)
+        if to is None:
+            cache.invalidate(lambda key: key[2] is None)
+        else:
+            to = to.lower()
+            # Cache keys are ``(args, sorted kwargs, block)``; ``to`` may have been passed either way.
+            cache.invalidate(
+                lambda key: key[2] is None
+                and str(key[0][0] if key[0] else dict(key[1]).get("to")).lower() == to
+            )
+
+    @staticmethod
+    def _results_to_columns(
+        results: list[Optional[tuple]], output_types: tuple[str, ...]
+    ) -> tuple[NDArray[np.bool_], list[NDArray]]:
+        """
+        Transposes decoded read results into one numpy array per output, plus a mask of the reads that succeeded.
+
+        Integer outputs become ``int64`` arrays when every value fits, otherwise ``object`` arrays of Python ints
+        (``uint256`` amounts). ``bool`` outputs become ``bool`` arrays, anything else ``object`` arrays. Failed reads
+        hold ``0``/``False``/``None``.
+        """
+        ok = np.fromiter((result is not None for result in results), dtype=bool, count=len(results))
+        columns = []
+        for i, abi_type in enumerate(output_types):
+            if abi_type == "bool":
+                columns.append(
+                    np.fromiter(
+                        (bool(r[i]) if r is not None else False for r in results),
+                        dtype=bool,
+                        count=len(results),
+                    )
+                )
+                continue
+            is_int = abi_type.startswith(("uint", "int")) and "[" not in abi_type
+            values = [r[i] if r is not None else (0 if is_int else None) for r in results]
+            if is_int and all(-(1 << 63) <= v < 1 << 63 for v in values):
+                columns.append(np.array(values, dtype=np.int64))
+                continue
+            # Filled element-wise so that sequence values are not taken as extra dimensions.
+            column = np.empty(len(values), dtype=object)
+            for j, value in enumerate(values):
+                column[j] = value
+            columns.append(column)
+        return ok, columns
+
+    def invalidate_fee_params(self):
+        """
+        Drops the cached transaction fee fields, so that the next transaction is priced from a fresh fee query.
+
+        Called after a failed submission, which may have been rejected as underpriced after a fee spike.
+        """
+        self._fee_params = None
+
+    def get_contract(self, address: str, abi: list) -> Any:
+        """
+        Returns a web3 ``Contract`` for ``address`` and ``abi``, built once and reused.
+
+        Constructing a contract parses the whole ABI, so callers should pass the same ABI object each time (the cache
+        is keyed by its identity), typically one returned by :func:`hetu.utils.abi.load_abi`.
+
+        Args:
+            address (str): Contract address.
+            abi (list): Contract ABI, as loaded JSON.
+
+        Returns:
+            web3.contract.Contract: The contract instance (an ``AsyncContract`` on the async client).
+        """
+        key = (address.lower(), id(abi))
+        entry = self._contracts.get(key)
+        if entry is None:
+            contract = self.web3.eth.contract(
+                address=checksum_address(address), abi=abi
+            )
+            # Keep a reference to the ABI so its id cannot be reused while cached.
+            entry = self._contracts[key] = (abi, contract)
+        return entry[1]
+
+    def _disk_call_key(self, to: str, data: str, block: int) -> str:
+        """Key of a block-pinned ``call`` result in the persistent call cache."""
+        return f"{self.chain_endpoint}|{to.lower()}|{data}|{block}"
+
     def _check_and_log_network_settings(self):
         if (
             self.network == "finney"
             or self.chain_endpoint == settings.FINNEY_ENTRYPOINT
-        ) and self.log_verbose:
-            logging.info(
-                f"You are connecting to {self.network} network with endpoint {self.chain_endpoint}."
+        ):
+            self._log(
+                stdlogging.INFO,
+                "You are connecting to %s network with endpoint %s.",
+                self.network,
+                self.chain_endpoint,
             )
-            logging.debug(
+            self._log(
+                stdlogging.DEBUG,
                 "We strongly encourage running a local hetu node whenever possible. "
-                "This increases decentralization and resilience of the network."
+                "This increases decentralization and resilience of the network.",
             )
 
     @staticmethod  # TODO can this be a class method?
@@ -0,0 +1,201 @@
+"""
+Lightweight ABI helpers for raw ``eth_call`` reads.
+
+Going through ``web3.contract.ContractFunction`` walks the ABI for every call. For hot read paths the selector,
+argument types and ``eth_abi`` tuple encoder/decoder of a function signature are built once and reused.
+"""
+
+import functools
+import json
+import re
+from typing import Any, Optional, Sequence
+
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+
+
+@functools.lru_cache(maxsize=None)
+def load_abi(path: str) -> list:
+    """
+    Loads a contract ABI JSON file once per process.
+
+    The returned list is shared between callers and must not be mutated. Passing it to
+    :meth:`hetu.hetu.Hetutensor.get_contract` also lets the contract object be reused, as that cache is keyed by the
+    ABI object.
+
+    Args:
+        path (str): Path to a JSON file holding either the ABI list or a build artifact with an ``"abi"`` key.
+
+    Returns:
+        list: The ABI entries.
+    """
+    with open(path) as f:
+        data = json.load(f)
+    return data["abi"] if isinstance(data, dict) else data
+
+
+@functools.lru_cache(maxsize=8192)
+def checksum_address(address: str) -> str:
+    """
+    Returns the EIP-55 checksummed form of ``address``.
+
+    Checksumming hashes the address with Keccak-256; the same few addresses are encoded over and over, so the
+    result is cached.
+    """
+    return to_checksum_address(address)
+
+
+def _split_types(types: str) -> tuple[str, ...]:
+    """Splits a comma separated ABI type list at the top level, keeping tuple types intact."""
+    parts, depth, start = [], 0, 0
+    for i, char in enumerate(types):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            parts.append(types[start:i])
+            start = i + 1
+    if types[start:]:
+        parts.append(types[start:])
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=512)
+def parse_signature(signature: str) -> tuple[bytes, tuple[str, ...]]:
+    """
+    Returns the 4-byte selector and the argument types of a function signature.
+
+    Args:
+        signature (str): Canonical signature without spaces, e.g. ``"balanceOf(address)"``.
+
+    Returns:
+        tuple[bytes, tuple[str, ...]]: The selector and the argument ABI types.
+    """
+    arg_types = signature[signature.index("(") + 1 : signature.rindex(")")]
+    return function_signature_to_4byte_selector(signature), _split_types(arg_types)
+
+
+@functools.lru_cache(maxsize=512)
+def _tuple_encoder(types: tuple[str, ...]) -> TupleEncoder:
+    # Same construction as ``eth_abi.encode``, which rebuilds it on every call.
+    return TupleEncoder(encoders=[registry.get_encoder(abi_type) for abi_type in types])
+
+
+@functools.lru_cache(maxsize=512)
+def _tuple_decoder(types: tuple[str, ...]) -> TupleDecoder:
+    # Same construction as ``eth_abi.decode``, which rebuilds it on every call.
+    return TupleDecoder(decoders=[registry.get_decoder(abi_type) for abi_type in types])
+
+
+_UINT_TYPE = re.compile(r"uint(\d*)")
+# Marker width of an ``address`` argument in :func:`_word_bits`.
+_ADDRESS = -1
+
+
+@functools.lru_cache(maxsize=512)
+def _word_bits(arg_types: tuple[str, ...]) -> Optional[tuple[int, ...]]:
+    """
+    Bit widths of ``arg_types`` if they are all ``uintN``/``bool``/``address`` (``0`` for ``bool``, ``_ADDRESS`` for
+    ``address``), else ``None``.
+
+    Such arguments are each one big-endian 32-byte word and can be encoded without ``eth_abi``.
+    """
+    bits = []
+    for arg_type in arg_types:
+        if arg_type in ("bool", "address"):
+            bits.append(0 if arg_type == "bool" else _ADDRESS)
+            continue
+        match = _UINT_TYPE.fullmatch(arg_type)
+        width = int(match.group(1) or 256) if match else 0
+        if not width or width % 8 or width > 256:
+            return None
+        bits.append(width)
+    return tuple(bits)
+
+
+def _encode_words(bits: tuple[int, ...], args: Sequence[Any]) -> Optional[bytes]:
+    """Encodes one-word arguments directly, or returns ``None`` if a value needs ``eth_abi`` validation."""
+    if len(args) != len(bits):
+        return None
+    words = bytearray()
+    for width, value in zip(bits, args):
+        if width == _ADDRESS:
+            if not isinstance(value, str) or len(value) != 42 or not value.startswith("0x"):
+                return None
+            try:
+                raw = bytes.fromhex(value[2:])
+            except ValueError:
+                return None
+            # ``fromhex`` skips whitespace.
+            if len(raw) != 20:
+                return None
+            words += raw.rjust(32, b"\0")
+            continue
+        if width == 0:
+            if not isinstance(value, bool):
+                return None
+        elif isinstance(value, bool) or not isinstance(value, int) or not 0 <= value < 1 << width:
+            return None
+        words += int(value).to_bytes(32, "big")
+    return bytes(words)
+
+
+def function_selector(signature: str) -> bytes:
+    """Returns the (cached) 4-byte selector of a function signature."""
+    return parse_signature(signature)[0]
+
+
+def encode_call(signature: str, args: Sequence[Any] = ()) -> str:
+    """
+    Encodes call data for ``signature`` with ``args``.
+
+    Returns:
+        str: ``0x`` prefixed call data.
+    """
+    selector, arg_types = parse_signature(signature)
+    bits = _word_bits(arg_types)
+    if bits is not None:
+        # Integer/bool/address-only calls (e.g. ``balanceOf(address)``) are plain 32-byte words.
+        words = _encode_words(bits, args)
+        if words is not None:
+            return "0x" + (selector + words).hex()
+    return "0x" + (selector + _tuple_encoder(arg_types)(list(args))).hex()
+
+
+def _decode_words(bits: tuple[int, ...], data: bytes) -> Optional[tuple]:
+    """Decodes one-word return values directly, or returns ``None`` if the data needs ``eth_abi`` validation."""
+    if len(data) < 32 * len(bits):
+        return None
+    values = []
+    for i, width in enumerate(bits):
+        word = data[32 * i : 32 * i + 32]
+        if width == _ADDRESS:
+            if any(word[:12]):
+                return None
+            values.append("0x" + word[12:].hex())
+            continue
+        value = int.from_bytes(word, "big")
+        if width == 0:
+            if value > 1:
+                return None
+            values.append(bool(value))
+        elif value >> width:
+            return None
+        else:
+            values.append(value)
+    return tuple(values)
+
+
+def decode_result(output_types: Sequence[str], data: bytes) -> tuple:
+    """Decodes raw return data into a tuple of values of ``output_types``."""
+    output_types = tuple(output_types)
+    bits = _word_bits(output_types)
+    if bits is not None:
+        # Static word results (balances, ``(uint256,...)`` structs, flags) are sliced out without ``eth_abi``.
+        values = _decode_words(bits, data)
+        if values is not None:
+            return values
+    return _tuple_decoder(output_types)(ContextFramesBytesIO(data))
@@ -41,3 +41,26 @@ def calculate_diff_seconds(
     diff_seconds = (current_time - synapse_nonce) / NANOSECONDS_IN_SECOND
     allowed_delta_seconds = (ALLOWED_DELTA + synapse_timeout_ns) / NANOSECONDS_IN_SECOND
     return diff_seconds, allowed_delta_seconds
+
+
+# Upper bound on how far in the future a dendrite session token may expire.
+MAX_SESSION_TOKEN_TTL = 300  # seconds
+
+# Upper bound on the number of verified session tokens an axon remembers.
+MAX_VERIFIED_AUTH_TOKENS = 4096
+
+
+def session_token_message(uuid: str, hotkey: str, axon_hotkey: str, expiry: int) -> str:
+    """
+    Builds the message a dendrite signs to obtain a session token for one axon.
+
+    Args:
+        uuid (str): The dendrite uuid.
+        hotkey (str): The dendrite hotkey (ETH address).
+        axon_hotkey (str): The hotkey of the axon the token is valid for, so it cannot be replayed against another one.
+        expiry (int): Unix timestamp in seconds after which the token is rejected.
+
+    Returns:
+        str: The message to be signed and verified.
+    """
+    return f"{uuid}.{hotkey}.{axon_hotkey}.{expiry}"
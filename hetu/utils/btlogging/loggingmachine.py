@@ -511,6 +511,14 @@ class LoggingMachine(StateMachine, Logger):
         msg = _concat_message(msg, prefix, suffix)
         self._logger.exception(msg, *args, **kwargs, stacklevel=stacklevel + 1)
 
+    def log(self, level: int, msg="", *args, stacklevel=1, **kwargs):
+        """Logs ``msg % args`` at ``level``. Formatting is deferred until the record is actually emitted."""
+        self._logger.log(level, msg, *args, **kwargs, stacklevel=stacklevel + 1)
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Returns whether a message of ``level`` would be processed by the underlying logger."""
+        return self._logger.isEnabledFor(level)
+
     def on(self):
         """Enable default state."""
         self._logger.info("Logging enabled.")
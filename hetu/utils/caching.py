@@ -0,0 +1,240 @@
+"""
+Small in-process caches for idempotent chain reads.
+"""
+
+import asyncio
+import concurrent.futures
+import functools
+import inspect
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+_MISSING = object()
+
+
+class TTLLRUCache:
+    """
+    A thread-safe, bounded LRU cache whose entries expire after a per-entry time to live.
+
+    Args:
+        maxsize (int): Maximum number of entries. The least recently used entry is evicted on overflow.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            value, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any, ttl: float):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, predicate: Optional[Callable[[Hashable], bool]] = None):
+        """Drops all entries, or only the entries whose key matches ``predicate``."""
+        with self._lock:
+            if predicate is None:
+                self._data.clear()
+                return
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskCache:
+    """
+    A persistent string key/value store backed by SQLite, for results that never change (e.g. reads pinned to a
+    past block). Safe to share between threads and between processes. Entries are kept forever unless stored with a
+    ``ttl``. ``hits`` and ``misses`` count the lookups of this instance.
+
+    Args:
+        path (str): Database file. Parent directories are created as needed.
+    """
+
+    def __init__(self, path: str):
+        path = os.path.expanduser(path)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] is not None and time.time() >= row[1]:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return row[0]
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None):
+        """
+        Stores ``value`` under ``key``, for ``ttl`` seconds if given. Expiry uses wall-clock time, as entries outlive
+        the process.
+        """
+        expires_at = None if ttl is None else time.time() + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, expires_at),
+            )
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def ttl_lru_cache(
+    maxsize: int = 4096,
+    ttl: float = 15.0,
+    latest_ttl: Optional[float] = None,
+    block_arg: str = "block",
+):
+    """
+    Caches the results of an instance method in a per-instance :class:`TTLLRUCache`.
+
+    Reads pinned to an explicit block keep ``ttl``. Reads against the latest block (``block=None``) use the
+    shorter ``latest_ttl`` so that they follow the chain head. ``None`` results are treated as failures and are not
+    cached. The cache of an instance is available as ``method.cache(instance)``; its keys are
+    ``(args, sorted kwargs, block)`` with the block argument taken out of ``args``/``kwargs``. Coroutine methods are
+    supported: the awaited result is cached.
+
+    Concurrent misses on the same key are collapsed ("single-flight"): the first caller runs the method, the others
+    wait for its result instead of issuing the same request again.
+
+    Args:
+        maxsize (int): Maximum number of entries per instance.
+        ttl (float): Time to live in seconds for block-pinned reads. ``float("inf")`` keeps them until evicted.
+        latest_ttl (Optional[float]): Time to live in seconds for latest-block reads. Defaults to ``ttl``.
+        block_arg (str): Name of the block number argument of the decorated method.
+    """
+    latest_ttl = ttl if latest_ttl is None else latest_ttl
+
+    def decorator(fn):
+        params = list(inspect.signature(fn).parameters)
+        # Position of the block argument in ``args`` (``self`` excluded).
+        block_index = params.index(block_arg) - 1 if block_arg in params else None
+        attr = f"_{fn.__name__}_cache"
+        inflight_attr = f"_{fn.__name__}_inflight"
+        inflight_lock = threading.Lock()
+
+        def get_cache(self) -> TTLLRUCache:
+            cache = self.__dict__.get(attr)
+            if cache is None:
+                cache = self.__dict__.setdefault(attr, TTLLRUCache(maxsize))
+            return cache
+
+        def make_key(args, kwargs) -> tuple[Hashable, Any]:
+            # The block is keyed separately so positional and keyword use share entries.
+            key_args, key_kwargs = args, kwargs
+            if block_arg in kwargs:
+                block = kwargs[block_arg]
+                key_kwargs = {k: v for k, v in kwargs.items() if k != block_arg}
+            elif block_index is not None and len(args) > block_index:
+                block = args[block_index]
+                key_args = args[:block_index] + args[block_index + 1 :]
+            else:
+                block = None
+            return (key_args, tuple(sorted(key_kwargs.items())), block), block
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def wrapper(self, *args, **kwargs):
+                key, block = make_key(args, kwargs)
+                cache = get_cache(self)
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                inflight = self.__dict__.setdefault(inflight_attr, {})
+                future = inflight.get(key)
+                if future is not None:
+                    try:
+                        return await asyncio.shield(future)
+                    except asyncio.CancelledError:
+                        # Only the leader was cancelled: run the call ourselves.
+                        if not future.cancelled() or asyncio.current_task().cancelling():
+                            raise
+                        return await wrapper(self, *args, **kwargs)
+                future = inflight[key] = asyncio.get_running_loop().create_future()
+                try:
+                    value = await fn(self, *args, **kwargs)
+                except asyncio.CancelledError:
+                    future.cancel()
+                    raise
+                except BaseException as e:
+                    future.set_exception(e)
+                    future.exception()  # Mark retrieved; the caller re-raises it.
+                    raise
+                finally:
+                    inflight.pop(key, None)
+                if value is not None:
+                    cache.set(key, value, latest_ttl if block is None else ttl)
+                future.set_result(value)
+                return value
+
+        else:
+
+            @functools.wraps(fn)
+            def wrapper(self, *args, **kwargs):
+                key, block = make_key(args, kwargs)
+                cache = get_cache(self)
+                value = cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+                with inflight_lock:
+                    inflight = self.__dict__.setdefault(inflight_attr, {})
+                    future = inflight.get(key)
+                    leader = future is None
+                    if leader:
+                        future = inflight[key] = concurrent.futures.Future()
+                if not leader:
+                    return future.result()
+                try:
+                    value = fn(self, *args, **kwargs)
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+                finally:
+                    with inflight_lock:
+                        inflight.pop(key, None)
+                if value is not None:
+                    cache.set(key, value, latest_ttl if block is None else ttl)
+                future.set_result(value)
+                return value
+
+        wrapper.cache = get_cache
+        return wrapper
+
+    return decorator
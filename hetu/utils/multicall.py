@@ -0,0 +1,73 @@
+"""
+Helpers for batching read-only ``eth_call`` requests through the `Multicall3 <https://www.multicall3.com>`_ contract.
+
+Multicall3 is deployed at the same address on most EVM chains. Routing several view calls through its
+``aggregate3`` method executes them in a single RPC round-trip against a single, consistent block.
+"""
+
+from typing import Optional, Union
+
+from hetu import settings
+from hetu.utils.abi import checksum_address, decode_result, encode_call
+
+MULTICALL3_ADDRESS = settings.MULTICALL3_ADDRESS
+
+AGGREGATE3 = "aggregate3((address,bool,bytes)[])"
+GET_ETH_BALANCE = "getEthBalance(address)"
+
+
+def to_bytes(data: Union[str, bytes]) -> bytes:
+    """Converts hex encoded call data or return data (with or without ``0x``) to bytes."""
+    if isinstance(data, (bytes, bytearray)):
+        return bytes(data)
+    return bytes.fromhex(data[2:] if data.startswith("0x") else data)
+
+
+def encode_aggregate3(
+    calls: list[tuple[str, Union[str, bytes]]], allow_failure: bool = True
+) -> str:
+    """
+    Encodes a batch of ``(to, data)`` calls as Multicall3 ``aggregate3`` call data.
+
+    Args:
+        calls (list[tuple[str, Union[str, bytes]]]): Target address and call data for each call.
+        allow_failure (bool): If ``False`` the whole multicall reverts when any call reverts.
+
+    Returns:
+        str: The ``0x`` prefixed call data for ``aggregate3``.
+    """
+    return encode_call(
+        AGGREGATE3,
+        [
+            [
+                (checksum_address(to), allow_failure, to_bytes(data))
+                for to, data in calls
+            ]
+        ],
+    )
+
+
+def decode_aggregate3(result: Union[str, bytes]) -> list[tuple[bool, bytes]]:
+    """
+    Decodes the return data of ``aggregate3`` into ``(success, return_data)`` pairs.
+
+    Args:
+        result (Union[str, bytes]): Raw return data of the multicall ``eth_call``.
+
+    Returns:
+        list[tuple[bool, bytes]]: One entry per call, in request order.
+    """
+    (results,) = decode_result(("(bool,bytes)[]",), to_bytes(result))
+    return [(bool(success), bytes(data)) for success, data in results]
+
+
+def encode_get_eth_balance(address: str) -> str:
+    """Encodes Multicall3 ``getEthBalance(address)`` call data."""
+    return encode_call(GET_ETH_BALANCE, [checksum_address(address)])
+
+
+def decode_uint256(data: bytes) -> Optional[int]:
+    """Decodes a single ``uint256`` return value, returning ``None`` for empty return data."""
+    if not data:
+        return None
+    return decode_result(("uint256",), data)[0]
@@ -4,9 +4,12 @@ import os
 from typing import Optional
 from urllib import request as urllib_request
 
+import aiohttp
 import netaddr
 import requests
 import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
 class ExternalIPNotFound(Exception):
@@ -140,3 +143,53 @@ def get_formatted_ws_endpoint_url(endpoint_url: Optional[str]) -> Optional[str]:
         endpoint_url = f"ws://{endpoint_url}"
 
     return endpoint_url
+
+
+def get_http_session(
+    pool_connections: int = 16, pool_maxsize: int = 32, retries: int = 3
+) -> requests.Session:
+    """
+    Returns a ``requests.Session`` with a keep-alive connection pool, suitable for web3 ``HTTPProvider``.
+
+    Only connection errors are retried, so a JSON-RPC request that reached the node is never sent twice.
+
+    Arguments:
+        pool_connections (int): Number of host pools to cache.
+        pool_maxsize (int): Maximum number of connections kept alive per host.
+        retries (int): Number of retries on connection errors.
+
+    Returns:
+        session (requests.Session): The configured session.
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries, connect=retries, read=0, status=0, backoff_factor=0.1
+        ),
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_async_http_session(
+    limit: int = 64, keepalive_timeout: float = 60.0
+) -> aiohttp.ClientSession:
+    """
+    Returns an ``aiohttp.ClientSession`` with a keep-alive connection pool, suitable for web3 ``AsyncHTTPProvider``.
+
+    Idle connections are kept for ``keepalive_timeout`` seconds (aiohttp's default is 15), so bursts of RPCs a few
+    seconds apart reuse warm TCP/TLS connections. Must be called from within a running event loop.
+
+    Arguments:
+        limit (int): Maximum number of simultaneous connections.
+        keepalive_timeout (float): Seconds an idle connection is kept open.
+
+    Returns:
+        session (aiohttp.ClientSession): The configured session.
+    """
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=limit, keepalive_timeout=keepalive_timeout)
+    )
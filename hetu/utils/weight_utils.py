@@ -1,6 +1,7 @@
 """Conversion for weight between chain representation and np.array or torch.Tensor"""
 
 import hashlib
+import logging as stdlogging
 import typing
 from typing import Union, Optional
 
@@ -122,9 +123,12 @@ def convert_root_weight_uids_and_vals_to_tensor(
         if use_torch()
         else np.zeros([n], dtype=np.float32)
     )
+    # uid -> position in subnets, built once instead of scanning the list per weight.
+    # Reversed so the first occurrence wins, as with list.index.
+    subnet_index = {uid: i for i, uid in reversed(list(enumerate(subnets)))}
     for uid_j, wij in list(zip(uids, weights)):
-        if uid_j in subnets:
-            index_s = subnets.index(uid_j)
+        index_s = subnet_index.get(uid_j)
+        if index_s is not None:
             row_weights[index_s] = float(
                 wij
             )  # assumes max-upscaled values (w_max = U16_MAX).
@@ -244,10 +248,11 @@ def process_weights_for_netuid(
             matches the type of the input weights (NumPy or PyTorch).
     """
 
-    logging.debug("process_weights_for_netuid()")
-    logging.debug(f"netuid {netuid}")
-    logging.debug(f"hetu: {hetu}")
-    logging.debug(f"metagraph: {metagraph}")
+    if logging.isEnabledFor(stdlogging.DEBUG):
+        logging.debug("process_weights_for_netuid()")
+        logging.debug(f"netuid {netuid}")
+        logging.debug(f"hetu: {hetu}")
+        logging.debug(f"metagraph: {metagraph}")
 
     # Get latest metagraph from chain if metagraph is None.
     if metagraph is None:
@@ -292,8 +297,11 @@ def process_weights(
             containing the array of user IDs and the corresponding normalized weights. The data type of the return
             matches the type of the input weights (NumPy or PyTorch).
     """
-    logging.debug("process_weights()")
-    logging.debug(f"weights: {weights}")
+    # Rendering weight arrays is costly, so the debug output is only built when it will be emitted.
+    debug = logging.isEnabledFor(stdlogging.DEBUG)
+    if debug:
+        logging.debug("process_weights()")
+        logging.debug(f"weights: {weights}")
 
     # Cast weights to floats.
     if use_torch():
@@ -306,9 +314,10 @@ def process_weights(
     # Network configuration parameters from an hetu.
     # These parameters determine the range of acceptable weights for each neuron.
     quantile = exclude_quantile / U16_MAX
-    logging.debug(f"quantile: {quantile}")
-    logging.debug(f"min_allowed_weights: {min_allowed_weights}")
-    logging.debug(f"max_weight_limit: {max_weight_limit}")
+    if debug:
+        logging.debug(f"quantile: {quantile}")
+        logging.debug(f"min_allowed_weights: {min_allowed_weights}")
+        logging.debug(f"max_weight_limit: {max_weight_limit}")
 
     # Find all non zero weights.
     non_zero_weight_idx = (
@@ -326,7 +335,8 @@ def process_weights(
             if use_torch()
             else np.ones(num_neurons, dtype=np.int64) / num_neurons
         )
-        logging.debug(f"final_weights: {final_weights}")
+        if debug:
+            logging.debug(f"final_weights: {final_weights}")
         final_weights_count = (
             torch.tensor(list(range(len(final_weights))))
             if use_torch()
@@ -349,7 +359,8 @@ def process_weights(
             else np.ones(num_neurons, dtype=np.int64) * 1e-5
         )  # creating minimum even non-zero weights
         weights[non_zero_weight_idx] += non_zero_weights
-        logging.debug(f"final_weights: {weights}")
+        if debug:
+            logging.debug(f"final_weights: {weights}")
         normalized_weights = normalize_max_weight(x=weights, limit=max_weight_limit)
         nw_arange = (
             torch.tensor(list(range(len(normalized_weights))))
@@ -358,7 +369,8 @@ def process_weights(
         )
         return nw_arange, normalized_weights
 
-    logging.debug(f"non_zero_weights: {non_zero_weights}")
+    if debug:
+        logging.debug(f"non_zero_weights: {non_zero_weights}")
 
     # Compute the exclude quantile and find the weights in the lowest quantile
     max_exclude = max(0, len(non_zero_weights) - min_allowed_weights) / len(
@@ -370,21 +382,24 @@ def process_weights(
         if use_torch()
         else np.quantile(non_zero_weights, exclude_quantile)
     )
-    logging.debug(f"max_exclude: {max_exclude}")
-    logging.debug(f"exclude_quantile: {exclude_quantile}")
-    logging.debug(f"lowest_quantile: {lowest_quantile}")
+    if debug:
+        logging.debug(f"max_exclude: {max_exclude}")
+        logging.debug(f"exclude_quantile: {exclude_quantile}")
+        logging.debug(f"lowest_quantile: {lowest_quantile}")
 
     # Exclude all weights below the allowed quantile.
     non_zero_weight_uids = non_zero_weight_uids[lowest_quantile <= non_zero_weights]
     non_zero_weights = non_zero_weights[lowest_quantile <= non_zero_weights]
-    logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids}")
-    logging.debug(f"non_zero_weights: {non_zero_weights}")
+    if debug:
+        logging.debug(f"non_zero_weight_uids: {non_zero_weight_uids}")
+        logging.debug(f"non_zero_weights: {non_zero_weights}")
 
     # Normalize weights and return.
     normalized_weights = normalize_max_weight(
         x=non_zero_weights, limit=max_weight_limit
     )
-    logging.debug(f"final_weights: {normalized_weights}")
+    if debug:
+        logging.debug(f"final_weights: {normalized_weights}")
 
     return non_zero_weight_uids, normalized_weights
 
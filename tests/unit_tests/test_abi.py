@@ -0,0 +1,189 @@
+"""
+test_abi.py, `poetry run pytest -s tests/`
+
+Tests for the raw ``eth_call`` ABI helpers, checked against ``eth_abi``.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import eth_abi
+import pytest
+from eth_abi.exceptions import DecodingError, EncodingError
+from eth_utils import to_checksum_address
+
+from hetu.utils import abi
+
+UINT256_MAX = 2**256 - 1
+ADDRESS = to_checksum_address("0x" + "ab" * 20)
+
+
+def _expected_call(signature, types, args):
+    return "0x" + (abi.function_selector(signature) + eth_abi.encode(types, args)).hex()
+
+
+def test_word_bits():
+    assert abi._word_bits(("uint256", "uint8", "bool", "address", "uint")) == (
+        256,
+        8,
+        0,
+        abi._ADDRESS,
+        256,
+    )
+    # Anything that is not a single static word goes through eth_abi.
+    assert abi._word_bits(("uint7",)) is None
+    assert abi._word_bits(("uint264",)) is None
+    assert abi._word_bits(("int256",)) is None
+    assert abi._word_bits(("bytes32",)) is None
+    assert abi._word_bits(("uint256[]",)) is None
+
+
+@pytest.mark.parametrize(
+    "signature, types, args",
+    [
+        ("f(uint256)", ["uint256"], [0]),
+        ("f(uint256)", ["uint256"], [UINT256_MAX]),
+        ("f(uint8,uint16)", ["uint8", "uint16"], [255, 65535]),
+        ("f(bool,bool)", ["bool", "bool"], [True, False]),
+        ("f(address)", ["address"], [ADDRESS]),
+        ("f(address)", ["address"], [ADDRESS.lower()]),
+        ("f(address)", ["address"], ["0x" + ADDRESS[2:].upper()]),
+        # eth_abi does not check the EIP-55 checksum of mixed case addresses.
+        ("f(address)", ["address"], ["0x" + "aB" * 20]),
+        ("f(address,uint16,bool)", ["address", "uint16", "bool"], [ADDRESS, 7, True]),
+    ],
+)
+def test_encode_call_fast_path_matches_eth_abi(signature, types, args):
+    assert abi._encode_words(abi._word_bits(tuple(types)), args) is not None
+    assert abi.encode_call(signature, args) == _expected_call(signature, types, args)
+
+
+@pytest.mark.parametrize(
+    "signature, args",
+    [
+        ("f(uint256)", [-1]),
+        ("f(uint256)", [2**256]),
+        ("f(uint8)", [256]),
+        ("f(address)", ["0x" + "xy" * 20]),
+        ("f(address)", ["0x" + "ab " * 13 + "a"]),
+        ("f(address)", ["0x" + "ab" * 19]),
+    ],
+)
+def test_encode_call_rejects_what_eth_abi_rejects(signature, args):
+    _, types = abi.parse_signature(signature)
+    assert abi._encode_words(abi._word_bits(types), args) is None
+    with pytest.raises(EncodingError):
+        abi.encode_call(signature, args)
+
+
+def test_encode_words_leaves_other_values_to_eth_abi():
+    # Integers for bools, bools for integers and non string addresses are not encoded directly.
+    assert abi._encode_words((0,), [1]) is None
+    assert abi._encode_words((256,), [True]) is None
+    assert abi._encode_words((abi._ADDRESS,), [bytes(20)]) is None
+    assert abi._encode_words((256, 256), [1]) is None
+
+
+@pytest.mark.parametrize(
+    "signature, selector",
+    [
+        ("transfer(address,uint256)", "a9059cbb"),
+        ("balanceOf(address)", "70a08231"),
+        ("aggregate3((address,bool,bytes)[])", "82ad56cb"),
+    ],
+)
+def test_function_selector(signature, selector):
+    assert abi.function_selector(signature).hex() == selector
+
+
+def test_parse_signature_keeps_tuples_intact():
+    assert abi.parse_signature("f()")[1] == ()
+    assert abi.parse_signature("f((address,bool,bytes)[],uint256,(uint8,(bool,string)))")[1] == (
+        "(address,bool,bytes)[]",
+        "uint256",
+        "(uint8,(bool,string))",
+    )
+
+
+@pytest.mark.parametrize(
+    "signature, types, args",
+    [
+        ("f()", [], []),
+        (
+            "aggregate3((address,bool,bytes)[])",
+            ["(address,bool,bytes)[]"],
+            [[(ADDRESS, True, b"\x01\x02"), (ADDRESS, False, b"")]],
+        ),
+        (
+            "f((uint8,(bool,string)),uint256[])",
+            ["(uint8,(bool,string))", "uint256[]"],
+            [(1, (True, "hi")), [1, 2, UINT256_MAX]],
+        ),
+        (
+            "f(string,bytes,address[],int256)",
+            ["string", "bytes", "address[]", "int256"],
+            ["hetu", b"\xff" * 40, [ADDRESS, ADDRESS], -5],
+        ),
+    ],
+)
+def test_encode_call_matches_eth_abi(signature, types, args):
+    assert abi.encode_call(signature, args) == _expected_call(signature, types, args)
+
+
+@pytest.mark.parametrize(
+    "types, values",
+    [
+        (("uint256",), (UINT256_MAX,)),
+        (("uint8", "bool", "bool"), (255, True, False)),
+        (("address", "uint128"), (ADDRESS.lower(), 2**128 - 1)),
+    ],
+)
+def test_decode_words_matches_eth_abi(types, values):
+    data = eth_abi.encode(types, values)
+    assert abi._decode_words(abi._word_bits(types), data) == values
+    assert abi.decode_result(types, data) == eth_abi.decode(types, data)
+
+
+@pytest.mark.parametrize(
+    "types, data",
+    [
+        # A bool word other than 0 or 1.
+        (("bool",), (2).to_bytes(32, "big")),
+        # A uint8 word with bits above the type width.
+        (("uint8",), (256).to_bytes(32, "big")),
+        # An address word with non zero padding.
+        (("address",), b"\x01" + bytes(11) + bytes.fromhex(ADDRESS[2:])),
+        # Truncated return data.
+        (("uint256", "uint256"), bytes(63)),
+        (("uint256",), b""),
+    ],
+)
+def test_decode_result_rejects_what_eth_abi_rejects(types, data):
+    assert abi._decode_words(abi._word_bits(types), data) is None
+    with pytest.raises(DecodingError):
+        abi.decode_result(types, data)
+
+
+@pytest.mark.parametrize(
+    "types, values",
+    [
+        (("uint256", "address", "bool", "int8"), (UINT256_MAX, ADDRESS.lower(), True, -1)),
+        (("string", "uint256[]"), ("hetu", (1, 2, UINT256_MAX))),
+        (("(bool,bytes)[]",), (((True, b"\x01" * 33), (False, b"")),)),
+        (("(uint16,(address,string))", "bytes32"), ((7, (ADDRESS.lower(), "x")), b"\x02" * 32)),
+    ],
+)
+def test_decode_result_matches_eth_abi(types, values):
+    data = eth_abi.encode(types, values)
+    assert abi.decode_result(types, data) == eth_abi.decode(types, data) == values
+    # The cached decoder is reused across calls.
+    assert abi.decode_result(list(types), data) == values
+
+
+def test_decoded_address_case_does_not_depend_on_sibling_types():
+    # Addresses decode lowercase, as eth_abi returns them, on the direct path and through eth_abi alike.
+    word_only = abi.decode_result(("address",), eth_abi.encode(["address"], [ADDRESS]))
+    mixed = abi.decode_result(("address", "string"), eth_abi.encode(["address", "string"], [ADDRESS, "x"]))
+    assert word_only[0] == mixed[0] == ADDRESS.lower()
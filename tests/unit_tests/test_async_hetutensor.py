@@ -0,0 +1,92 @@
+"""
+test_async_hetutensor.py, `poetry run pytest -s tests/`
+
+Offline tests for AsyncHetutensor: RPCs are replaced on the instance, no node is needed.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import asyncio
+import gc
+
+from hetu.async_hetutensor import AsyncHetutensor
+
+
+def _address(i: int) -> str:
+    return f"0x{i:040x}"
+
+
+def _batching_client(multicall) -> AsyncHetutensor:
+    client = AsyncHetutensor(network="local", call_batch_window=0.01)
+    client.multicall = multicall
+    return client
+
+
+def test_concurrent_calls_are_sent_as_one_multicall():
+    batches = []
+
+    async def multicall(calls, block=None, allow_failure=True):
+        batches.append((list(calls), block))
+        return [bytes([i]) for i in range(len(calls))]
+
+    async def main():
+        client = _batching_client(multicall)
+        return await asyncio.gather(
+            *(client.call(_address(i), "0x12345678", block=7) for i in range(1, 4))
+        )
+
+    results = asyncio.run(main())
+    # Same format as an unbatched call.
+    assert results == [bytes([i]).hex() for i in range(3)]
+    assert batches == [
+        ([(_address(i), "0x12345678") for i in range(1, 4)], 7)
+    ]
+
+
+def test_batch_error_reaches_every_waiter():
+    unhandled = []
+
+    async def multicall(calls, block=None, allow_failure=True):
+        raise RuntimeError("multicall broke")
+
+    async def main():
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: unhandled.append(context)
+        )
+        client = _batching_client(multicall)
+        results = await asyncio.gather(
+            *(client.call(_address(i), "0x12345678") for i in range(1, 4)),
+            return_exceptions=True,
+        )
+        # Let the batch task finish and be collected: its failure must not be reported as unretrieved.
+        await asyncio.sleep(0)
+        gc.collect()
+        return results
+
+    results = asyncio.run(main())
+    assert len(results) == 3
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert unhandled == []
+
+
+def test_wait_for_transaction_receipts_accepts_str_and_bytes_hashes():
+    requests = []
+
+    async def make_batch_request(batch):
+        requests.extend(params[0] for _, params in batch)
+        return [{"result": {"status": "0x1", "blockNumber": "0x10"}} for _ in batch]
+
+    async def main():
+        client = AsyncHetutensor(network="local")
+        client.web3.provider.make_batch_request = make_batch_request
+        return await client.wait_for_transaction_receipts(
+            ["0x" + "AB" * 32, bytes.fromhex("cd" * 32)], timeout=1, poll_latency=0.01
+        )
+
+    receipts = asyncio.run(main())
+    expected = ["0x" + "ab" * 32, "0x" + "cd" * 32]
+    assert requests == expected
+    assert receipts == {tx_hash: {"status": 1, "blockNumber": 16} for tx_hash in expected}
@@ -0,0 +1,121 @@
+"""
+test_axon.py, `poetry run pytest -s tests/`
+
+Offline tests for the axon session token check: no server is started.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import importlib
+import time
+import uuid
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from hetu.axon import Axon
+from hetu.config import Config
+from hetu.synapse import TerminalInfo
+from hetu.utils.axon_utils import session_token_message
+
+# ``hetu.axon`` the attribute is the Axon class (see hetu.utils.easy_imports), so fetch the module itself.
+axon_module = importlib.import_module("hetu.axon")
+
+
+def _axon() -> Axon:
+    return Axon(
+        account=Account.create(),
+        config=Config(),
+        port=8094,
+        ip="127.0.0.1",
+        external_ip="127.0.0.1",
+        external_port=8094,
+        max_workers=1,
+    )
+
+
+def _dendrite(account, axon_hotkey: str, expiry: int, signer=None) -> TerminalInfo:
+    dendrite_uuid = uuid.uuid4().hex
+    message = session_token_message(dendrite_uuid, account.address, axon_hotkey, expiry)
+    signature = (signer or account).sign_message(encode_defunct(text=message)).signature
+    return TerminalInfo(
+        uuid=dendrite_uuid,
+        hotkey=account.address,
+        auth_token=f"{expiry}.0x{signature.hex()}",
+    )
+
+
+def test_valid_token_is_verified_once():
+    axon = _axon()
+    dendrite = _dendrite(Account.create(), axon.wallet.address, int(time.time()) + 60)
+    axon._verify_auth_token(dendrite)
+    axon._verify_auth_token(dendrite)
+    assert len(axon.verified_auth_tokens) == 1
+
+
+def test_expired_token_is_rejected():
+    axon = _axon()
+    dendrite = _dendrite(Account.create(), axon.wallet.address, int(time.time()) - 1)
+    with pytest.raises(Exception, match="expired"):
+        axon._verify_auth_token(dendrite)
+    assert len(axon.verified_auth_tokens) == 0
+
+
+def test_token_expires_after_verification(monkeypatch):
+    axon = _axon()
+    now = int(time.time())
+    dendrite = _dendrite(Account.create(), axon.wallet.address, now + 10)
+    axon._verify_auth_token(dendrite)
+    monkeypatch.setattr(axon_module.time, "time", lambda: now + 10)
+    with pytest.raises(Exception, match="expired"):
+        axon._verify_auth_token(dendrite)
+    assert len(axon.verified_auth_tokens) == 0
+
+
+def test_too_long_lived_token_is_rejected():
+    axon = _axon()
+    expiry = int(time.time()) + axon_module.MAX_SESSION_TOKEN_TTL + 60
+    with pytest.raises(Exception, match="maximum"):
+        axon._verify_auth_token(_dendrite(Account.create(), axon.wallet.address, expiry))
+
+
+def test_forged_token_is_rejected():
+    axon = _axon()
+    # Signed by another key than the claimed dendrite hotkey.
+    dendrite = _dendrite(
+        Account.create(), axon.wallet.address, int(time.time()) + 60, signer=Account.create()
+    )
+    with pytest.raises(Exception, match="mismatch"):
+        axon._verify_auth_token(dendrite)
+    assert len(axon.verified_auth_tokens) == 0
+
+
+def test_malformed_token_is_rejected():
+    axon = _axon()
+    dendrite = TerminalInfo(uuid=uuid.uuid4().hex, hotkey=Account.create().address, auth_token="nope")
+    with pytest.raises(Exception, match="Malformed"):
+        axon._verify_auth_token(dendrite)
+
+
+def test_token_replayed_against_another_axon_is_rejected():
+    first, second = _axon(), _axon()
+    dendrite = _dendrite(Account.create(), first.wallet.address, int(time.time()) + 60)
+    first._verify_auth_token(dendrite)
+    with pytest.raises(Exception, match="mismatch"):
+        second._verify_auth_token(dendrite)
+
+
+def test_verified_tokens_are_bounded(monkeypatch):
+    monkeypatch.setattr(axon_module, "MAX_VERIFIED_AUTH_TOKENS", 2)
+    axon = _axon()
+    expiry = int(time.time()) + 60
+    dendrites = [_dendrite(Account.create(), axon.wallet.address, expiry) for _ in range(3)]
+    for dendrite in dendrites:
+        axon._verify_auth_token(dendrite)
+    assert len(axon.verified_auth_tokens) == 2
+    # The least recently used token was evicted.
+    assert not any(key.startswith(dendrites[0].hotkey) for key in axon.verified_auth_tokens)
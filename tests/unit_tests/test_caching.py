@@ -0,0 +1,252 @@
+"""
+test_caching.py, `poetry run pytest -s tests/`
+
+Tests for the in-process read caches, with a fake clock.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hetu.utils import caching
+from hetu.utils.caching import TTLLRUCache, ttl_lru_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(caching, "time", clock)
+    return clock
+
+
+class Reader:
+    def __init__(self, result=lambda key, block: f"{key}@{block}"):
+        self.result = result
+        self.calls = 0
+
+    @ttl_lru_cache(maxsize=16, ttl=100.0, latest_ttl=2.0)
+    def read(self, key, block=None):
+        self.calls += 1
+        return self.result(key, block)
+
+
+def test_ttl_lru_cache_entry_expires(clock):
+    cache = TTLLRUCache()
+    cache.set("a", 1, ttl=10)
+    clock.now += 9.9
+    assert cache.get("a") == 1
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.get("a", "missing") == "missing"
+    assert len(cache) == 0
+
+
+def test_ttl_lru_cache_evicts_least_recently_used(clock):
+    cache = TTLLRUCache(maxsize=2)
+    cache.set("a", 1, ttl=10)
+    cache.set("b", 2, ttl=10)
+    assert cache.get("a") == 1  # "b" is now the least recently used entry
+    cache.set("c", 3, ttl=10)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_lru_cache_invalidate(clock):
+    cache = TTLLRUCache()
+    for key in ("a1", "a2", "b1"):
+        cache.set(key, key, ttl=10)
+    cache.invalidate(lambda key: key.startswith("a"))
+    assert [cache.get(key) for key in ("a1", "a2", "b1")] == [None, None, "b1"]
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+def test_cached_method_latest_and_pinned_ttl(clock):
+    reader = Reader()
+    assert reader.read("x") == "x@None"
+    assert reader.read("x") == "x@None"
+    assert reader.calls == 1
+    # Latest-block reads use latest_ttl.
+    clock.now += 2
+    reader.read("x")
+    assert reader.calls == 2
+    # Block-pinned reads use ttl; positional and keyword blocks share the entry.
+    assert reader.read("x", 5) == "x@5"
+    assert reader.read("x", block=5) == "x@5"
+    assert reader.calls == 3
+    clock.now += 99
+    reader.read("x", 5)
+    assert reader.calls == 3
+    clock.now += 1
+    reader.read("x", 5)
+    assert reader.calls == 4
+
+
+def test_cached_method_does_not_cache_none(clock):
+    reader = Reader(result=lambda key, block: None)
+    assert reader.read("x") is None
+    assert reader.read("x") is None
+    assert reader.calls == 2
+
+
+def test_cached_method_cache_is_per_instance(clock):
+    first, second = Reader(), Reader()
+    first.read("x")
+    second.read("x")
+    assert (first.calls, second.calls) == (1, 1)
+    assert Reader.read.cache(first) is not Reader.read.cache(second)
+    Reader.read.cache(first).invalidate()
+    first.read("x")
+    assert first.calls == 2
+
+
+def test_cached_method_single_flight_sync():
+    started, release = threading.Event(), threading.Event()
+
+    def slow(key, block):
+        started.set()
+        release.wait(5)
+        return key
+
+    reader = Reader(result=slow)
+    with ThreadPoolExecutor(max_workers=5) as pool:
+        leader = pool.submit(reader.read, "x")
+        assert started.wait(5)
+        followers = [pool.submit(reader.read, "x") for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result(5)] + [f.result(5) for f in followers]
+    assert results == ["x"] * 5
+    assert reader.calls == 1
+
+
+def test_cached_method_single_flight_sync_propagates_errors():
+    started, release = threading.Event(), threading.Event()
+
+    def failing(key, block):
+        started.set()
+        release.wait(5)
+        raise ValueError("node error")
+
+    reader = Reader(result=failing)
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        leader = pool.submit(reader.read, "x")
+        assert started.wait(5)
+        followers = [pool.submit(reader.read, "x") for _ in range(2)]
+        time.sleep(0.05)
+        release.set()
+        for future in [leader] + followers:
+            with pytest.raises(ValueError):
+                future.result(5)
+
+
+class AsyncReader:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+        self.gate = asyncio.Event()
+
+    @ttl_lru_cache(maxsize=16, ttl=100.0, latest_ttl=2.0)
+    async def read(self, key, block=None):
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail:
+            raise ValueError("node error")
+        return key
+
+
+def test_cached_coroutine_single_flight():
+    async def main():
+        reader = AsyncReader()
+        tasks = [asyncio.create_task(reader.read("x")) for _ in range(5)]
+        await asyncio.sleep(0)
+        reader.gate.set()
+        results = await asyncio.gather(*tasks)
+        # Served from the cache afterwards.
+        assert await reader.read("x") == "x"
+        return results, reader.calls
+
+    assert asyncio.run(main()) == (["x"] * 5, 1)
+
+
+def test_cached_coroutine_single_flight_propagates_errors():
+    async def main():
+        reader = AsyncReader(fail=True)
+        tasks = [asyncio.create_task(reader.read("x")) for _ in range(3)]
+        await asyncio.sleep(0)
+        reader.gate.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return results, reader.calls
+
+    results, calls = asyncio.run(main())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert calls == 1
+
+
+def test_cached_coroutine_follower_survives_cancelled_leader():
+    async def main():
+        reader = AsyncReader()
+        leader = asyncio.create_task(reader.read("x"))
+        follower = asyncio.create_task(reader.read("x"))
+        await asyncio.sleep(0)
+        leader.cancel()
+        await asyncio.sleep(0)
+        reader.gate.set()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        # The follower runs the call itself instead of inheriting the cancellation.
+        return await follower, reader.calls
+
+    assert asyncio.run(main()) == ("x", 2)
+
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    path = str(tmp_path / "nested" / "calls.sqlite")
+    cache = caching.DiskCache(path)
+    cache.set("key", "0x01")
+    cache.set("key", "0x02")
+    cache.close()
+
+    reopened = caching.DiskCache(path)
+    try:
+        assert reopened.get("key") == "0x02"
+        assert reopened.get("other") is None
+        assert (reopened.hits, reopened.misses) == (1, 1)
+    finally:
+        reopened.close()
+
+
+def test_disk_cache_entry_expires(tmp_path, clock):
+    cache = caching.DiskCache(str(tmp_path / "calls.sqlite"))
+    try:
+        cache.set("short", "a", ttl=10)
+        cache.set("forever", "b")
+        clock.now += 9
+        assert cache.get("short") == "a"
+        clock.now += 1
+        assert cache.get("short") is None
+        clock.now += 10**9
+        assert cache.get("forever") == "b"
+        assert (cache.hits, cache.misses) == (2, 1)
+    finally:
+        cache.close()
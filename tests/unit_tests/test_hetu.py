@@ -112,4 +112,66 @@ def test_dendrite_call_axon():
     try:
         asyncio.run(_run())
     finally:
-        axon.stop()
\ No newline at end of file
+        axon.stop()
+
+def test_dendrite_session_token_call_axon():
+    """Test Dendrite in session token mode is accepted by the Axon."""
+    config = Config()
+    wallet = Account.create()
+    axon = ht.Axon(
+        account=wallet,
+        config=config,
+        port=8093,
+        ip="127.0.0.1",
+        external_ip="127.0.0.1",
+        external_port=8093,
+        max_workers=2,
+    )
+
+    def echo_forward(s: EchoSynapse) -> EchoSynapse:
+        s.output = s.input
+        return s
+
+    axon.attach(forward_fn=echo_forward)
+    axon.serve(netuid=1, hetutensor=None)
+    axon.start()
+
+    async def _run():
+        dendrite = Dendrite(account=Account.create(), session_token_ttl=60)
+        first = await dendrite.call(axon.info(), synapse=EchoSynapse(input="a"), timeout=3)
+        second = await dendrite.call(axon.info(), synapse=EchoSynapse(input="b"), timeout=3)
+        assert first.output == "a"
+        assert second.output == "b"
+        # One token signed for both requests, verified once by the axon.
+        assert len(axon.verified_auth_tokens) == 1
+        await dendrite.aclose_session()
+
+    try:
+        asyncio.run(_run())
+    finally:
+        axon.stop()
+
+
+def test_wait_for_transaction_receipts_accepts_str_and_bytes_hashes():
+    """Receipts are keyed by the normalized hash whether it was given as a hex string or as bytes."""
+    client = Hetutensor(network="local")
+    str_hash = "0x" + "AB" * 32
+    bytes_hash = bytes.fromhex("cd" * 32)
+    polled = []
+
+    def poll_receipts(tx_hashes):
+        polled.append(list(tx_hashes))
+        return {tx_hash: {"status": "0x1", "blockNumber": "0x10"} for tx_hash in tx_hashes}
+
+    client._poll_receipts = poll_receipts
+    receipts = client.wait_for_transaction_receipts(
+        [str_hash, bytes_hash], timeout=1, poll_latency=0.01, full=False
+    )
+    expected = ["0x" + "ab" * 32, "0x" + "cd" * 32]
+    assert polled == [expected]
+    assert receipts == {tx_hash: {"status": 1, "blockNumber": 16} for tx_hash in expected}
+    # A string hash without the 0x prefix is accepted too.
+    assert client.wait_for_transaction_receipt("ab" * 32, timeout=1, poll_latency=0.01, full=False) == {
+        "status": 1,
+        "blockNumber": 16,
+    }
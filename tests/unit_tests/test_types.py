@@ -0,0 +1,121 @@
+"""
+test_types.py, `poetry run pytest -s tests/`
+
+Tests for the pure helpers shared by the sync and async clients.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import numpy as np
+import pytest
+
+from hetu.hetu import Hetutensor
+from hetu.types import HetutensorMixin
+
+GWEI = 10**9
+
+
+def _fee_params(history: dict):
+    return HetutensorMixin._fee_params_from_history(history)
+
+
+def test_fee_params_from_raw_history():
+    # Raw JSON-RPC payload: hex quantities, one more base fee than blocks (the next block's).
+    history = {
+        "oldestBlock": "0x10",
+        "baseFeePerGas": [hex(GWEI), hex(2 * GWEI), hex(3 * GWEI)],
+        "gasUsedRatio": [0.5, 0.9],
+        "reward": [[hex(5 * GWEI)], [hex(1 * GWEI)]],
+    }
+    # Median of the sorted tips [1, 5] gwei picks the upper one.
+    assert _fee_params(history) == {
+        "maxFeePerGas": 2 * 3 * GWEI + 5 * GWEI,
+        "maxPriorityFeePerGas": 5 * GWEI,
+        "type": 2,
+    }
+
+
+def test_fee_params_from_decoded_history():
+    history = {"baseFeePerGas": [7, 9], "reward": [[3], [1], [2]]}
+    assert _fee_params(history) == {"maxFeePerGas": 20, "maxPriorityFeePerGas": 2, "type": 2}
+
+
+@pytest.mark.parametrize("reward", [None, [], [[], []]])
+def test_fee_params_without_rewards(reward):
+    history = {"baseFeePerGas": [hex(GWEI), hex(GWEI)]}
+    if reward is not None:
+        history["reward"] = reward
+    assert _fee_params(history) == {"maxFeePerGas": 2 * GWEI, "maxPriorityFeePerGas": 0, "type": 2}
+
+
+def test_fee_params_with_zero_tips():
+    history = {"baseFeePerGas": ["0x64", "0x64"], "reward": [["0x0"], ["0x0"]]}
+    assert _fee_params(history) == {"maxFeePerGas": 200, "maxPriorityFeePerGas": 0, "type": 2}
+
+
+@pytest.mark.parametrize(
+    "history",
+    [
+        {},
+        {"reward": [["0x1"]]},
+        {"baseFeePerGas": None},
+        {"baseFeePerGas": []},
+        {"baseFeePerGas": ["0x0", "0x0"], "reward": [["0x1"]]},
+    ],
+)
+def test_fee_params_without_base_fee(history):
+    # No EIP-1559 on this chain: the caller falls back to legacy gas pricing.
+    assert _fee_params(history) is None
+
+
+def test_results_to_columns_types_and_failed_reads():
+    results = [(1, True, "0xaa", (1, 2)), None, (-3, False, "0xbb", ())]
+    ok, (ints, flags, addresses, arrays) = HetutensorMixin._results_to_columns(
+        results, ("int256", "bool", "address", "uint256[]")
+    )
+    assert ok.tolist() == [True, False, True]
+    assert ints.dtype == np.int64 and ints.tolist() == [1, 0, -3]
+    assert flags.dtype == bool and flags.tolist() == [True, False, False]
+    assert addresses.dtype == object and addresses.tolist() == ["0xaa", None, "0xbb"]
+    # Sequence values stay one element each instead of adding a dimension.
+    assert arrays.dtype == object and arrays.shape == (3,)
+    assert arrays[0] == (1, 2) and arrays[1] is None
+
+
+@pytest.mark.parametrize(
+    "values, dtype",
+    [
+        ([0, 2**63 - 1], np.int64),
+        ([-(2**63), 1], np.int64),
+        ([1, 2**63], object),
+        ([2**256 - 1, 5], object),
+        ([-(2**63) - 1, 0], object),
+    ],
+)
+def test_results_to_columns_int64_bounds(values, dtype):
+    _, (column,) = HetutensorMixin._results_to_columns([(v,) for v in values], ("int256",))
+    assert column.dtype == dtype
+    # Values above int64 are kept exactly as Python ints.
+    assert column.tolist() == values
+
+
+def test_multiread_columns():
+    client = Hetutensor(network="local")
+    reads = []
+
+    def multiread(calls, block=None):
+        reads.extend(calls)
+        return [(10, 2**200), None, (30, 1)]
+
+    client.multiread = multiread
+    ok, (small, large) = client.multiread_columns(
+        "0x" + "11" * 20, "f(uint256)", [(1,), (2,), (3,)], ("uint64", "uint256")
+    )
+    assert [args for _, _, args, _ in reads] == [(1,), (2,), (3,)]
+    assert ok.tolist() == [True, False, True]
+    assert small.dtype == np.int64 and small.tolist() == [10, 0, 30]
+    assert large.dtype == object and large.tolist() == [2**200, 0, 1]
+    assert int(large[ok].sum()) == 2**200 + 1